@@ -12,13 +12,54 @@ __version__ = "0.1.0"
 __author__ = "Harry Winkler"
 __email__ = "harry@fumblebee.site"
 
-# Core functionality imports
-from .config import AIProvider, Config, ConfigError, get_config
-from .extractors import FileProcessor, FileUploadSecurity
-from .processors import TextAnalyzer
-from .prompts import OutputFormat, PromptTone, gen_analysis, gen_suggestions
-from .renderers import DocumentStyler, UnifiedLatexConverter
-from .utils import BeetuneError, ProcessingError, ValidationError
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public names are imported lazily on first attribute access (PEP 562), so
+# ``import beetune`` does not pull in openai, PyPDF2, python-docx or libmagic
+# until the functionality that needs them is actually used.
+_LAZY_IMPORTS = {
+    "AIProvider": ".config",
+    "Config": ".config",
+    "ConfigError": ".config",
+    "get_config": ".config",
+    "FileProcessor": ".extractors",
+    "FileUploadSecurity": ".extractors",
+    "TextAnalyzer": ".processors",
+    "OutputFormat": ".prompts",
+    "PromptTone": ".prompts",
+    "gen_analysis": ".prompts",
+    "gen_suggestions": ".prompts",
+    "DocumentStyler": ".renderers",
+    "UnifiedLatexConverter": ".renderers",
+    "BeetuneError": ".utils",
+    "ProcessingError": ".utils",
+    "ValidationError": ".utils",
+}
+
+if TYPE_CHECKING:
+    from .config import AIProvider, Config, ConfigError, get_config
+    from .extractors import FileProcessor, FileUploadSecurity
+    from .processors import TextAnalyzer
+    from .prompts import OutputFormat, PromptTone, gen_analysis, gen_suggestions
+    from .renderers import DocumentStyler, UnifiedLatexConverter
+    from .utils import BeetuneError, ProcessingError, ValidationError
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in ``dir(beetune)``."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Version info
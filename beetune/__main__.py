@@ -4,7 +4,7 @@ Entry point for running beetune as a module.
 
 import argparse
 
-from .server import app
+from .server import run_server
 
 
 def main() -> None:
@@ -12,11 +12,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="beetune server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
 
     args = parser.parse_args()
 
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    run_server(args.host, args.port, debug=args.debug, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -8,19 +8,32 @@ and analyzing job descriptions.
 # mypy: ignore-errors
 
 import argparse
+import functools
+import shlex
 import sys
 from getpass import getpass
 from pathlib import Path
 
 from .config import AIProvider, ConfigError, get_config
-from .extractors import FileProcessor
-from .processors import TextAnalyzer
-from .renderers import DocumentStyler, LaTeXStyle
 from .utils import BeetuneError
 
+# Descriptions shown when choosing a provider during setup
+_PROVIDER_DESCRIPTIONS = {
+    AIProvider.OPENAI: "OpenAI GPT models",
+    AIProvider.ANTHROPIC: "Claude models",
+    AIProvider.OLLAMA: "Local Ollama server",
+    AIProvider.CUSTOM: "Custom OpenAI-compatible API",
+}
+
+# How long analyze-job reuses a saved analysis of the same description (seconds)
+_ANALYSIS_CACHE_TTL = 7 * 24 * 3600
+
 
 def format_resume_command(args) -> int:
     """Handle the format-resume command."""
+    from .extractors import FileProcessor
+    from .renderers import DocumentStyler, LaTeXStyle
+
     try:
         # Read input file
         input_path = Path(args.input)
@@ -36,7 +49,7 @@ def format_resume_command(args) -> int:
         # Format as LaTeX
         formatter = DocumentStyler()
         style = LaTeXStyle(args.style)
-        latex_content = formatter.format_document(resume_text, style=style)
+        latex_content = formatter.style_document(resume_text, style=style)
 
         # Write output
         if args.output:
@@ -58,6 +71,10 @@ def format_resume_command(args) -> int:
 
 def analyze_job_command(args) -> int:
     """Handle the analyze-job command."""
+    import sqlite3
+
+    from .processors import ResponseCache, TextAnalyzer
+
     try:
         # Get configuration
         config = get_config()
@@ -76,15 +93,21 @@ def analyze_job_command(args) -> int:
             with open(args.input, "r", encoding="utf-8") as f:
                 job_description = f.read()
 
-        # Analyze job description
-        analyzer = TextAnalyzer(api_key, base_url=endpoint, default_model=model)
-        analysis = analyzer.analyze_job_description(job_description)
+        # Analyze job description; with --cache, re-runs on the same text reuse the saved result
+        cache = None
+        if args.cache:
+            try:
+                cache = ResponseCache(ttl=_ANALYSIS_CACHE_TTL, path=ResponseCache.default_path())
+            except (OSError, sqlite3.Error):
+                pass  # An unwritable cache location only costs the reuse
+        analyzer = TextAnalyzer(api_key, base_url=endpoint, default_model=model, cache=cache)
+        analysis = analyzer.analyze(job_description)
 
         # Output results
         print("📋 Job Analysis Results")
         print("=" * 40)
-        print(f"\n🔑 Keywords:\n{analysis['keywords']}")
-        print(f"\n💰 Benefits:\n{analysis['benefits']}")
+        for key, value in analysis.items():
+            print(f"\n🔑 {key.title()}:\n{value}")
 
         return 0
 
@@ -116,14 +139,7 @@ def setup_command(args) -> int:
         print("Available providers:")
         providers = list(AIProvider)
         for i, provider in enumerate(providers, 1):
-            if provider == AIProvider.OPENAI:
-                print(f"  {i}. {provider.value} - OpenAI GPT models")
-            elif provider == AIProvider.ANTHROPIC:
-                print(f"  {i}. {provider.value} - Claude models")
-            elif provider == AIProvider.OLLAMA:
-                print(f"  {i}. {provider.value} - Local Ollama server")
-            elif provider == AIProvider.CUSTOM:
-                print(f"  {i}. {provider.value} - Custom OpenAI-compatible API")
+            print(f"  {i}. {provider.value} - {_PROVIDER_DESCRIPTIONS[provider]}")
 
         while True:
             try:
@@ -192,6 +208,8 @@ def setup_command(args) -> int:
         if args.test:
             print("\n🧪 Testing configuration...")
             try:
+                from .processors import TextAnalyzer
+
                 analyzer = TextAnalyzer(api_key, base_url=endpoint, default_model=model)
                 # Simple test with a minimal job description
                 test_result = analyzer.analyze(
@@ -268,12 +286,17 @@ def server_command(args) -> int:
     """Handle the server command."""
     try:
         # Import server module
-        import sys
-
         from .server import main as server_main
 
         # Prepare arguments for server
-        server_args = ["--host", args.host, "--port", str(args.port)]
+        server_args = [
+            "--host",
+            args.host,
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+        ]
 
         if args.debug:
             server_args.append("--debug")
@@ -300,8 +323,37 @@ def server_command(args) -> int:
         return 1
 
 
-def main() -> int:
-    """Main CLI entry point."""
+def batch_command(args) -> int:
+    """Handle the batch command."""
+    parser = _build_parser()
+    status = 0
+
+    for line in sys.stdin:
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            continue
+        if tokens[0] == "batch":
+            print("Error: 'batch' cannot be nested")
+            status = 1
+            continue
+
+        try:
+            command_args = parser.parse_args(tokens)
+        except SystemExit as e:
+            # argparse exits on --help (code 0) and on invalid arguments
+            if e.code:
+                status = 1
+            continue
+
+        if _run_command(command_args) != 0:
+            status = 1
+
+    return status
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="beetune - Resume analysis and formatting toolkit", prog="beetune"
     )
@@ -336,6 +388,14 @@ def main() -> int:
     # analyze-job command
     analyze_parser = subparsers.add_parser("analyze-job", help="Analyze a job description")
     analyze_parser.add_argument("input", help='Job description file (use "-" for stdin)')
+    analyze_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Save the analysis to ~/.cache/beetune/responses.sqlite3 for 7 days "
+            "and reuse it when the same description is analyzed again"
+        ),
+    )
 
     # version command
     subparsers.add_parser("version", help="Show version information")
@@ -348,10 +408,21 @@ def main() -> int:
     server_parser.add_argument(
         "--port", type=int, default=8000, help="Port to bind to (default: 8000)"
     )
+    server_parser.add_argument(
+        "--workers", type=int, default=1, help="Number of worker processes (default: 1)"
+    )
     server_parser.add_argument("--debug", action="store_true", help="Enable debug mode")
 
-    args = parser.parse_args()
+    # batch command
+    subparsers.add_parser(
+        "batch", help="Run commands read from stdin, one per line, in a single process"
+    )
 
+    return parser
+
+
+def _run_command(args) -> int:
+    """Dispatch parsed arguments to their command handler."""
     if args.command == "setup":
         return setup_command(args)
     elif args.command == "config":
@@ -367,10 +438,17 @@ def main() -> int:
         return 0
     elif args.command == "server":
         return server_command(args)
+    elif args.command == "batch":
+        return batch_command(args)
     else:
-        parser.print_help()
+        _build_parser().print_help()
         return 1
 
 
+def main() -> int:
+    """Main CLI entry point."""
+    return _run_command(_build_parser().parse_args())
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,13 +4,14 @@ Configuration management for beetune.
 Handles storing and retrieving API keys, endpoints, and other user settings.
 """
 
-import json
+import copy
+import functools
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from .utils import BeetuneError
+from .utils import BeetuneError, serialization
 
 
 class AIProvider(Enum):
@@ -28,6 +29,16 @@ class ConfigError(BeetuneError):
     pass
 
 
+# Endpoints stored for providers configured without an explicit one
+_DEFAULT_ENDPOINTS: Dict[AIProvider, str] = {
+    AIProvider.OPENAI: "https://api.openai.com/v1",
+    AIProvider.ANTHROPIC: "https://api.anthropic.com",
+}
+
+# Parsed config files keyed by path, with the (mtime_ns, size) they were read at
+_file_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
 class Config:
     """Configuration manager for beetune."""
 
@@ -40,29 +51,87 @@ class Config:
         self.config_dir = config_dir or Path.home() / ".beetune"
         self.config_file = self.config_dir / "config.json"
         self._config_data: Dict[str, Any] = {}
+        # Set once the directory has been created (or found) by a save
+        self._dir_ready = False
         self._load_config()
 
     def _load_config(self) -> None:
-        """Load configuration from file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r") as f:
-                    self._config_data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                raise ConfigError(f"Failed to load config file: {e}")
-        else:
+        """Load configuration from file, reusing the parsed data if the file is unchanged."""
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             self._config_data = {}
+            return
+        except OSError as e:
+            raise ConfigError(f"Failed to load config file: {e}")
+
+        cached = _file_cache.get(self.config_file)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self._config_data = copy.deepcopy(cached[2])
+            return
+
+        try:
+            self._config_data = serialization.loads(self.config_file.read_bytes())
+        except (ValueError, IOError) as e:
+            # Never serve the previous contents of a file that no longer parses
+            _file_cache.pop(self.config_file, None)
+            raise ConfigError(f"Failed to load config file: {e}")
+        _file_cache[self.config_file] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            copy.deepcopy(self._config_data),
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all parsed config files, so the next load reads from disk."""
+        _file_cache.clear()
 
     def _save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file, skipping the write if the file already holds it."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w") as f:
-                json.dump(self._config_data, f, indent=2)
-            # Set restrictive permissions for security
-            os.chmod(self.config_file, 0o600)
+            cached = _file_cache.get(self.config_file)
+            if cached is not None and cached[2] == self._config_data:
+                stat = self.config_file.stat()
+                if cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    return
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise ConfigError(f"Failed to save config file: {e}")
+
+        try:
+            if not self._dir_ready:
+                # The directory holds API keys, so only the owner may list it
+                self.config_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                self._dir_ready = True
+            # Write then rename, so readers never see a partial file. The file is
+            # created owner-only, so the API key is never readable by others.
+            partial = self.config_file.with_name(f"{self.config_file.name}.{os.getpid()}.tmp")
+            data = serialization.dumps(self._config_data, pretty=True)
+            try:
+                # A stale file from a crashed save may have looser permissions
+                partial.unlink()
+            except FileNotFoundError:
+                pass
+            fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(partial, self.config_file)
+            except BaseException:
+                partial.unlink()
+                raise
+            stat = self.config_file.stat()
         except IOError as e:
+            # The directory may have been removed; check it again on the next save
+            self._dir_ready = False
             raise ConfigError(f"Failed to save config file: {e}")
+        _file_cache[self.config_file] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            copy.deepcopy(self._config_data),
+        )
 
     def set_provider(
         self,
@@ -81,17 +150,14 @@ class Config:
         """
         provider_config = {"api_key": api_key, "model": model}
 
+        # Fall back to the default endpoint for known providers
+        endpoint = endpoint or _DEFAULT_ENDPOINTS.get(provider)
         if endpoint:
             provider_config["endpoint"] = endpoint
 
-        # Set default endpoints for known providers
-        if provider == AIProvider.OPENAI and not endpoint:
-            provider_config["endpoint"] = "https://api.openai.com/v1"
-        elif provider == AIProvider.ANTHROPIC and not endpoint:
-            provider_config["endpoint"] = "https://api.anthropic.com"
-
-        self._config_data[provider.value] = provider_config
-        self._config_data["active_provider"] = provider.value
+        name = provider.value
+        self._config_data[name] = provider_config
+        self._config_data["active_provider"] = name
         self._save_config()
 
     def get_active_provider(self) -> Optional[str]:
@@ -141,11 +207,12 @@ class Config:
 
     def list_providers(self) -> Dict[str, Dict[str, Any]]:
         """List all configured providers."""
-        providers = {}
-        for key, value in self._config_data.items():
-            if key != "active_provider" and isinstance(value, dict):
-                providers[key] = value
-        return providers
+        # Parsed JSON objects are always plain dicts, so an exact type check suffices
+        return {
+            key: value
+            for key, value in self._config_data.items()
+            if key != "active_provider" and type(value) is dict
+        }
 
     def remove_provider(self, provider: str) -> None:
         """Remove a provider configuration."""
@@ -161,19 +228,12 @@ class Config:
         return bool(self.get_active_provider())
 
 
-# Global config instance
-_config = None
-
-
+@functools.lru_cache(maxsize=None)
 def get_config() -> Config:
     """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
 
 
 def reset_config() -> None:
     """Reset the global configuration instance (mainly for testing)."""
-    global _config
-    _config = None
+    get_config.cache_clear()
@@ -4,17 +4,95 @@ File text extraction utilities for beetune.
 Provides secure text extraction from various file formats including PDF, DOCX, and LaTeX.
 """
 
-from typing import BinaryIO
+import atexit
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import docx
 import PyPDF2
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - depends on optional dependency
+    pdfium = None
+
 from ..utils import ProcessingError
+from . import pdf_router
+
+logger = logging.getLogger(__name__)
+
+# Number of extracted texts kept, keyed by content hash and file kind
+EXTRACTION_CACHE_SIZE = 64
+
+_extraction_cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+# Joins the text of consecutive PDF pages; shared by every backend so results match
+_PAGE_SEPARATOR = "\n"
+
+# PDFs with at least this many pages are extracted across processes by the PyPDF2 backend
+PAGE_PARALLEL_THRESHOLD = 8
+
+# Set to False to keep PyPDF2 extraction in the calling process (the API server does this)
+PAGE_PARALLEL_ENABLED = True
+
+# Upper bound on page worker processes; each one receives its own copy of the PDF bytes
+_MAX_PAGE_WORKERS = 4
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _page_workers() -> int:
+    """Return the number of worker processes used for page-parallel extraction."""
+    return max(1, min(os.cpu_count() or 1, _MAX_PAGE_WORKERS))
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for page-parallel PDF extraction.
+
+    Workers are started with ``spawn`` so that creating the pool from a
+    threaded caller never forks a copy of another thread's held locks.
+    """
+    global _page_pool
+    if _page_pool is None:
+        with _page_pool_lock:
+            if _page_pool is None:
+                _page_pool = ProcessPoolExecutor(
+                    max_workers=_page_workers(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(_page_pool.shutdown)
+    return _page_pool
+
+
+def _extract_page_range(data: bytes, first: int, last: int) -> List[str]:
+    """Extract the text of pages ``first`` to ``last - 1`` of a PDF (runs in a worker)."""
+    pdf_reader = PyPDF2.PdfReader(BytesIO(data))
+    return [pdf_reader.pages[i].extract_text() or "" for i in range(first, last)]
 
 
 class FileProcessor:
     """Secure file text extraction for resume processing."""
 
+    # Supported extension -> (cache kind, name of the extraction method)
+    _EXTRACTORS: Dict[str, Tuple[str, str]] = {
+        "pdf": ("pdf", "_extract_from_pdf"),
+        "docx": ("docx", "_extract_from_docx"),
+        "doc": ("docx", "_extract_from_docx"),
+        "tex": ("tex", "_read_text"),
+    }
+
     @staticmethod
     def extract_text(file_stream: BinaryIO, filename: str) -> str:
         """
@@ -31,38 +109,166 @@ class FileProcessor:
             ProcessingError: If file type is unsupported or extraction fails
         """
         try:
-            file_extension = filename.lower().split(".")[-1]
-
-            if file_extension == "pdf":
-                return FileProcessor._extract_from_pdf(file_stream)
-            elif file_extension in ["docx", "doc"]:
-                return FileProcessor._extract_from_docx(file_stream)
-            elif file_extension == "tex":
-                return file_stream.read().decode("utf-8")
-            else:
+            file_extension = filename.rpartition(".")[2].lower()
+            dispatch = FileProcessor._EXTRACTORS.get(file_extension)
+            if dispatch is None:
                 raise ProcessingError(f"Unsupported file type: {file_extension}")
+            kind, method_name = dispatch
+            extractor: Callable[[BinaryIO], str] = getattr(FileProcessor, method_name)
+
+            # Extraction is a pure function of the content, so repeated files hit the cache
+            key = FileProcessor._cache_key(file_stream, kind)
+            if key is not None:
+                with _extraction_cache_lock:
+                    cached = _extraction_cache.get(key)
+                    if cached is not None:
+                        _extraction_cache.move_to_end(key)
+                        return cached
+
+            text = extractor(file_stream)
+
+            if key is not None:
+                with _extraction_cache_lock:
+                    _extraction_cache[key] = text
+                    while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                        _extraction_cache.popitem(last=False)
+            return text
         except Exception as e:
             if isinstance(e, ProcessingError):
                 raise
             raise ProcessingError(f"Failed to extract text from {filename}: {str(e)}")
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached extraction result."""
+        with _extraction_cache_lock:
+            _extraction_cache.clear()
+
+    @staticmethod
+    def _cache_key(file_stream: BinaryIO, kind: str) -> Optional[Tuple[bytes, str]]:
+        """Hash the remaining stream content without consuming it (None if not seekable)."""
+        # SpooledTemporaryFile (Werkzeug uploads) has no seekable() before Python 3.11
+        seekable = getattr(file_stream, "seekable", None)
+        if seekable is not None and not seekable():
+            return None
+        try:
+            position = file_stream.tell()
+        except (AttributeError, OSError):
+            return None
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: file_stream.read(65536), b""):
+            digest.update(chunk)
+        file_stream.seek(position)
+        return digest.digest(), kind
+
+    @staticmethod
+    def _read_text(file_stream: BinaryIO) -> str:
+        """Decode a UTF-8 text stream without holding a full copy of its bytes."""
+        if not isinstance(file_stream, io.IOBase):
+            return file_stream.read().decode("utf-8")
+
+        # newline="" keeps line endings untouched; detach so the caller's stream stays open
+        wrapper = io.TextIOWrapper(file_stream, encoding="utf-8", newline="")
+        try:
+            return wrapper.read()
+        finally:
+            wrapper.detach()
+
+    @staticmethod
+    def process_many(
+        paths: Sequence[Union[str, "os.PathLike[str]"]], max_workers: int = 8
+    ) -> List[str]:
+        """
+        Extract text from many files on local storage.
+
+        Files are read concurrently so their I/O latency overlaps instead of
+        being paid one file at a time.
+
+        Args:
+            paths: Paths of the files to process
+            max_workers: Maximum number of files read at once
+
+        Returns:
+            Extracted text for each path, in input order
+
+        Raises:
+            ProcessingError: If a file cannot be read or its extraction fails
+        """
+
+        def _process(path: Union[str, "os.PathLike[str]"]) -> str:
+            file_path = Path(path)
+            try:
+                data = file_path.read_bytes()
+            except OSError as e:
+                raise ProcessingError(f"Failed to read {file_path}: {str(e)}")
+            return FileProcessor.extract_text(BytesIO(data), file_path.name)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(_process, paths))
+
     @staticmethod
     def _extract_from_pdf(file_stream: BinaryIO) -> str:
         """Extract text from PDF file stream."""
         try:
-            pdf_reader = PyPDF2.PdfReader(file_stream)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text.strip()
+            if pdfium is not None:
+                text, page_count = FileProcessor._read_pdf_pdfium(file_stream)
+            else:
+                text, page_count = FileProcessor._read_pdf_pypdf2(file_stream)
+            text = text.strip()
+
+            decision = pdf_router.route(text, page_count)
+            if decision.method == "ocr":
+                logger.warning(
+                    "PDF has little embedded text and may be scanned; "
+                    "no OCR backend is configured, returning the embedded text"
+                )
+            return text
         except Exception as e:
             raise ProcessingError(f"Failed to process PDF file: {str(e)}")
 
+    @staticmethod
+    def _read_pdf_pdfium(file_stream: BinaryIO) -> Tuple[str, int]:
+        """Read the text layer and page count of a PDF with PDFium."""
+        pdf = pdfium.PdfDocument(file_stream.read())
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return _PAGE_SEPARATOR.join(pages), len(pdf)
+        finally:
+            pdf.close()
+
+    @staticmethod
+    def _read_pdf_pypdf2(file_stream: BinaryIO) -> Tuple[str, int]:
+        """Read the text layer and page count of a PDF with PyPDF2."""
+        start = file_stream.tell()
+        pdf_reader = PyPDF2.PdfReader(file_stream)
+        page_count = len(pdf_reader.pages)
+
+        if not PAGE_PARALLEL_ENABLED or page_count < PAGE_PARALLEL_THRESHOLD:
+            parts = [page.extract_text() or "" for page in pdf_reader.pages]
+            return _PAGE_SEPARATOR.join(parts), page_count
+
+        # Large documents: each worker process parses its own copy and extracts a page range.
+        # At most one chunk per worker, and never fewer pages per chunk than the threshold,
+        # so the PDF is pickled only as often as it pays off.
+        file_stream.seek(start)
+        data = file_stream.read()
+        workers = min(_page_workers(), page_count // PAGE_PARALLEL_THRESHOLD)
+        step = -(-page_count // workers)
+        firsts = range(0, page_count, step)
+        lasts = [min(first + step, page_count) for first in firsts]
+        chunks = _get_page_pool().map(_extract_page_range, [data] * len(firsts), firsts, lasts)
+        return _PAGE_SEPARATOR.join(text for chunk in chunks for text in chunk), page_count
+
     @staticmethod
     def _extract_from_docx(file_stream: BinaryIO) -> str:
         """Extract text from DOCX file stream."""
         try:
             doc = docx.Document(file_stream)
-            return " ".join([paragraph.text for paragraph in doc.paragraphs]).strip()
+            return " ".join(p.text for p in doc.paragraphs if p.text).strip()
         except Exception as e:
             raise ProcessingError(f"Failed to process DOCX file: {str(e)}")
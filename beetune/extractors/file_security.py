@@ -5,28 +5,80 @@ Provides comprehensive validation for file uploads including extension validatio
 MIME type checking, and secure filename generation.
 """
 
-from typing import BinaryIO, Dict, Optional, Set
+import functools
+import os
+import queue
+import re
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, FrozenSet, Iterator, Optional, Set
 
 import magic
 
 from ..utils import ProcessingError, ValidationError
 
+# Characters not allowed in secure filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9._-]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_filename(filename: str) -> str:
+    """Sanitize a filename; pure, so results are memoized."""
+    # Remove path separators and other dangerous characters
+    filename = filename.replace("../", "_")
+    filename = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+
+    # Remove leading dots and underscores
+    filename = filename.lstrip("._")
+
+    # Ensure filename isn't empty after cleaning
+    return filename or "upload"
+
+
+# Number of libmagic cookies shared by all threads. Each cookie handles one
+# detection at a time; a detection takes microseconds, so a small fixed pool
+# serves many concurrent uploads and bounds the memory held by loaded databases.
+MIME_DETECTOR_POOL_SIZE = 4
+
+_mime_detectors: "queue.SimpleQueue[magic.Magic]" = queue.SimpleQueue()
+_mime_detectors_filled = False
+_mime_detectors_lock = threading.Lock()
+
+
+@contextmanager
+def _borrow_mime_detector() -> Iterator[magic.Magic]:
+    """Borrow a MIME detector, filling the pool on first use and waiting if all are busy."""
+    global _mime_detectors_filled
+    if not _mime_detectors_filled:
+        with _mime_detectors_lock:
+            if not _mime_detectors_filled:
+                for _ in range(MIME_DETECTOR_POOL_SIZE):
+                    _mime_detectors.put(magic.Magic(mime=True))
+                _mime_detectors_filled = True
+    detector = _mime_detectors.get()
+    try:
+        yield detector
+    finally:
+        _mime_detectors.put(detector)
+
 
 class FileUploadSecurity:
     """Security utilities for file uploads."""
 
     # Default allowed file extensions
-    DEFAULT_ALLOWED_EXTENSIONS = {"pdf", "doc", "docx", "tex"}
+    DEFAULT_ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({"pdf", "doc", "docx", "tex"})
 
     # MIME type mappings for allowed file extensions
-    ALLOWED_MIME_TYPES: Dict[str, Set[str]] = {
-        "pdf": {"application/pdf"},
-        "doc": {"application/msword"},
-        "docx": {
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "application/vnd.ms-word.document.macroEnabled.12",
-        },
-        "tex": {"text/plain", "application/x-tex", "text/x-tex"},
+    ALLOWED_MIME_TYPES: Dict[str, FrozenSet[str]] = {
+        "pdf": frozenset({"application/pdf"}),
+        "doc": frozenset({"application/msword"}),
+        "docx": frozenset(
+            {
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                "application/vnd.ms-word.document.macroEnabled.12",
+            }
+        ),
+        "tex": frozenset({"text/plain", "application/x-tex", "text/x-tex"}),
     }
 
     def __init__(self, allowed_extensions: Optional[Set[str]] = None):
@@ -36,14 +88,17 @@ class FileUploadSecurity:
         Args:
             allowed_extensions: Set of allowed file extensions. If None, uses defaults.
         """
-        self.allowed_extensions = allowed_extensions or self.DEFAULT_ALLOWED_EXTENSIONS
+        self.allowed_extensions = (
+            frozenset(allowed_extensions) if allowed_extensions else self.DEFAULT_ALLOWED_EXTENSIONS
+        )
 
     def validate_file_upload(self, file_stream: BinaryIO, filename: str) -> str:
         """
         Comprehensive file upload validation.
 
         Args:
-            file_stream: Binary file stream to validate
+            file_stream: Binary file stream to validate, positioned at the start.
+                It is left at the start for extraction.
             filename: Original filename
 
         Returns:
@@ -62,10 +117,10 @@ class FileUploadSecurity:
             raise ValidationError("Invalid filename", "Filename contains only unsafe characters")
 
         # Validate file extension
-        self._validate_extension(secure_name)
+        extension = self._validate_extension(secure_name)
 
         # Validate MIME type
-        self._validate_mime_type(file_stream, secure_name)
+        self._validate_mime_type(file_stream, extension)
 
         return secure_name
 
@@ -79,28 +134,15 @@ class FileUploadSecurity:
         Returns:
             Secure filename
         """
-        # Basic secure filename implementation
-        # Remove path separators and other dangerous characters
-        import re
-
-        filename = filename.replace("../", "_")
-        filename = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+        return _sanitize_filename(filename)
 
-        # Remove leading dots and underscores
-        filename = filename.lstrip("._")
-
-        # Ensure filename isn't empty after cleaning
-        if not filename:
-            return "upload"
-
-        return filename
-
-    def _validate_extension(self, filename: str) -> None:
-        """Validate file extension against allowed extensions."""
-        if "." not in filename:
+    def _validate_extension(self, filename: str) -> str:
+        """Validate file extension against allowed extensions and return it."""
+        _, dot, extension = filename.rpartition(".")
+        if not dot:
             raise ValidationError("No file extension", "File must have a valid extension")
 
-        extension = filename.lower().split(".")[-1]
+        extension = extension.lower()
 
         if extension not in self.allowed_extensions:
             allowed_extensions_str = ", ".join(sorted(self.allowed_extensions))
@@ -109,26 +151,38 @@ class FileUploadSecurity:
                 f"File extension '{extension}' not allowed. Allowed extensions: {allowed_extensions_str}",
             )
 
-    def _validate_mime_type(self, file_stream: BinaryIO, filename: str) -> None:
+        return extension
+
+    @staticmethod
+    def _read_header(file_stream: BinaryIO, size: int) -> bytes:
+        """Return the first ``size`` bytes of a stream, leaving it positioned at the start."""
+        # Callers are expected to pass a rewound stream; rewinding is cheap insurance
+        file_stream.seek(0)
+
+        # Buffered streams can serve the header straight from their buffer
+        peek = getattr(file_stream, "peek", None)
+        if peek is not None:
+            return bytes(peek(size)[:size])
+
+        file_header = file_stream.read(size)
+        file_stream.seek(0)
+        return file_header
+
+    def _validate_mime_type(self, file_stream: BinaryIO, extension: str) -> None:
         """Validate MIME type using python-magic."""
         try:
-            # Reset file stream position
-            current_pos = file_stream.tell()
-            file_stream.seek(0)
-
             # Read a small portion of the file for MIME detection
-            file_header = file_stream.read(1024)
-            file_stream.seek(current_pos)  # Reset to original position
+            file_header = self._read_header(file_stream, 1024)
 
             if not file_header:
                 raise ValidationError("Empty file", "Uploaded file appears to be empty")
 
             # Detect MIME type
-            detected_mime = magic.from_buffer(file_header, mime=True)
+            with _borrow_mime_detector() as detector:
+                detected_mime = detector.from_buffer(file_header)
 
             # Get expected MIME types for this extension
-            extension = filename.lower().split(".")[-1]
-            expected_mimes = self.ALLOWED_MIME_TYPES.get(extension, set())
+            expected_mimes = self.ALLOWED_MIME_TYPES.get(extension, frozenset())
 
             if expected_mimes and detected_mime not in expected_mimes:
                 expected_mimes_str = ", ".join(sorted(expected_mimes))
@@ -146,24 +200,36 @@ class FileUploadSecurity:
             )
 
     def get_file_info(self, file_stream: BinaryIO, filename: str) -> Dict[str, str]:
-        """Get detailed file information for logging/debugging."""
+        """Get detailed file information for logging/debugging.
+
+        Seekable streams are left at the start. Non-seekable streams (pipes,
+        sockets) are read to the end to count their size.
+        """
         try:
-            current_pos = file_stream.tell()
-            file_stream.seek(0)
+            seekable = getattr(file_stream, "seekable", None)
+            if seekable is None or seekable():
+                file_header = self._read_header(file_stream, 1024)
+                file_size = file_stream.seek(0, os.SEEK_END)
+                file_stream.seek(0)
+            else:
+                file_header = file_stream.read(1024)
+                file_size = len(file_header) + sum(
+                    len(chunk) for chunk in iter(lambda: file_stream.read(65536), b"")
+                )
 
-            file_header = file_stream.read(1024)
-            file_stream.seek(0)
-            file_content = file_stream.read()
-            file_stream.seek(current_pos)
+            detected_mime = "unknown"
+            if file_header:
+                with _borrow_mime_detector() as detector:
+                    detected_mime = detector.from_buffer(file_header)
 
-            detected_mime = magic.from_buffer(file_header, mime=True) if file_header else "unknown"
+            _, dot, extension = filename.rpartition(".")
 
             return {
                 "original_filename": filename,
                 "secure_filename": self._secure_filename(filename),
                 "detected_mime_type": detected_mime,
-                "file_size_bytes": str(len(file_content)),
-                "extension": filename.lower().split(".")[-1] if "." in filename else "none",
+                "file_size_bytes": str(file_size),
+                "extension": extension.lower() if dot else "none",
             }
         except Exception as e:
             return {"original_filename": filename, "error": f"Could not analyze file: {str(e)}"}
@@ -0,0 +1,53 @@
+"""
+PDF routing utilities for beetune.
+
+Decides whether a PDF carries an embedded text layer that can be used as-is,
+or whether it looks like a scanned document that needs OCR.
+"""
+
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Characters per page expected from a text-based PDF
+EXPECTED_CHARS_PER_PAGE = 500
+
+# Minimum confidence required to treat a PDF as text-based
+TEXT_CONFIDENCE_THRESHOLD = 0.8
+
+
+@dataclass
+class PdfRoute:
+    """Result of PDF routing."""
+
+    method: str  # "text" or "ocr"
+    confidence: float
+    page_count: int
+
+
+def route(text: str, page_count: int) -> PdfRoute:
+    """
+    Classify a PDF as text-based or scanned from its embedded text layer.
+
+    The confidence score is the amount of text found relative to what a
+    text-based document with the same number of pages would contain.
+
+    Args:
+        text: Text extracted from the PDF's embedded text layer
+        page_count: Number of pages in the PDF
+
+    Returns:
+        PdfRoute with method "text" when the text layer is usable, else "ocr"
+    """
+    confidence = min(1.0, len(text) / max(1, page_count * EXPECTED_CHARS_PER_PAGE))
+    method = "text" if confidence >= TEXT_CONFIDENCE_THRESHOLD else "ocr"
+
+    logger.debug(
+        "PDF routed to '%s' extraction (pages=%d, chars=%d, confidence=%.2f)",
+        method,
+        page_count,
+        len(text),
+        confidence,
+    )
+    return PdfRoute(method=method, confidence=confidence, page_count=page_count)
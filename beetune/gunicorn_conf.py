@@ -0,0 +1,38 @@
+"""
+Gunicorn settings for serving the beetune API in production.
+
+Usage::
+
+    gunicorn -c python:beetune.gunicorn_conf beetune.server:app
+
+Requests mostly wait on OpenAI and on pdflatex subprocesses, so each worker
+process runs several threads. Command line flags such as ``--workers`` or
+``--worker-class`` override these settings. Each worker builds its LaTeX
+converter (and runs the engine check) as soon as it is forked, so the first
+``/convert/latex`` request does not pay for it.
+"""
+
+import multiprocessing
+import os
+from typing import Any
+
+bind = "0.0.0.0:8000"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("BEETUNE_THREADS", 8))
+
+# LaTeX compilation may run two 60 second passes
+timeout = 150
+graceful_timeout = 30
+keepalive = 5
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Build the LaTeX converter before the worker takes its first request."""
+    from beetune.server import get_latex_converter
+
+    try:
+        get_latex_converter()
+    except RuntimeError as e:
+        # The API still serves everything else; /convert/latex reports the error
+        worker.log.warning("LaTeX converter unavailable: %s", e)
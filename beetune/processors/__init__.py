@@ -4,6 +4,7 @@ Text processing utilities for beetune.
 This module provides AI-powered analysis tools for text.
 """
 
+from .response_cache import ResponseCache
 from .text_analyzer import TextAnalyzer
 
-__all__ = ["TextAnalyzer"]
+__all__ = ["ResponseCache", "TextAnalyzer"]
@@ -0,0 +1,131 @@
+"""
+Concurrent request processing for beetune.
+
+Runs many chat completion requests against an ``AsyncOpenAI`` client with a
+bounded number of workers, throttled to stay within requests-per-minute and
+tokens-per-minute limits, and retries transient failures.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: rate limiting, transient network failures and 5xx responses
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+class _CapacityTracker:
+    """Token-bucket throttle over both request and token capacity."""
+
+    def __init__(self, max_rpm: float, max_tpm: float):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.available_requests = max_rpm
+        self.available_tokens = max_tpm
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.available_requests = min(
+            self.max_rpm, self.available_requests + self.max_rpm * elapsed / 60.0
+        )
+        self.available_tokens = min(
+            self.max_tpm, self.available_tokens + self.max_tpm * elapsed / 60.0
+        )
+        self.last_update = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and ``tokens`` tokens of capacity are available."""
+        tokens = min(tokens, int(self.max_tpm))
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.available_requests >= 1 and self.available_tokens >= tokens:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                missing_requests = max(0.0, 1 - self.available_requests)
+                missing_tokens = max(0.0, tokens - self.available_tokens)
+                delay = max(
+                    missing_requests * 60.0 / self.max_rpm,
+                    missing_tokens * 60.0 / self.max_tpm,
+                )
+            await asyncio.sleep(delay)
+
+
+def estimate_tokens(request: Dict[str, Any]) -> int:
+    """Roughly estimate the token cost of a chat completion request."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in request.get("messages", []))
+    return prompt_chars // 4 + int(request.get("max_tokens") or 0)
+
+
+async def run_many(
+    aclient: Any,
+    requests: Sequence[Dict[str, Any]],
+    num_concurrent: int = 10,
+    max_rpm: float = 500,
+    max_tpm: float = 200_000,
+    max_attempts: int = 5,
+) -> List[Union[Optional[str], BaseException]]:
+    """
+    Run chat completion requests concurrently under rate limits.
+
+    Args:
+        aclient: ``AsyncOpenAI`` client used to issue requests
+        requests: Chat completion keyword arguments, one per request
+        num_concurrent: Number of worker tasks issuing requests
+        max_rpm: Requests-per-minute budget
+        max_tpm: Tokens-per-minute budget
+        max_attempts: Attempts per request before giving up on retryable errors
+
+    Returns:
+        Completion content for each request in input order, or the exception
+        that made it fail
+    """
+    results: List[Union[Optional[str], BaseException]] = [None] * len(requests)
+    queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+    for index, request in enumerate(requests):
+        queue.put_nowait((index, request, 1))
+    capacity = _CapacityTracker(max_rpm, max_tpm)
+
+    async def worker() -> None:
+        while True:
+            index, request, attempt = await queue.get()
+            try:
+                await capacity.acquire(estimate_tokens(request))
+                response = await aclient.chat.completions.create(**request)
+                results[index] = response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_attempts:
+                    logger.error("Request %d failed after %d attempts: %s", index, attempt, e)
+                    results[index] = e
+                else:
+                    logger.debug("Request %d attempt %d failed, retrying: %s", index, attempt, e)
+                    await asyncio.sleep(min(2.0**attempt, 30.0))
+                    # Re-enqueue before task_done() so join() never sees an empty queue early
+                    queue.put_nowait((index, request, attempt + 1))
+            except Exception as e:
+                results[index] = e
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, num_concurrent))]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    return results
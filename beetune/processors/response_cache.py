@@ -0,0 +1,336 @@
+"""
+Response caching utilities for beetune.
+
+Provides a cache for AI completions so repeated (or, optionally,
+near-identical) prompts can be answered without another API round-trip.
+Exact matches can additionally be persisted to disk and shared between runs.
+Semantic lookups are scored with a single matrix-vector product when ``numpy``
+is installed (``pip install beetune[fast]``) and in pure Python otherwise.
+"""
+
+import functools
+import hashlib
+import json
+import math
+import operator
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Seconds between sweeps of expired in-memory entries, run from ``set``
+_SWEEP_INTERVAL = 60.0
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Import numpy on the first semantic lookup; None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on optional dependency
+        return None
+    return numpy
+
+
+class _SemanticSnapshot:
+    """Immutable view of one namespace's vectors, scored outside the cache lock."""
+
+    def __init__(self, keys: Tuple[str, ...], stored_at: Tuple[float, ...], rows: Tuple[Any, ...]):
+        self.keys = keys
+        self.stored_at = stored_at
+        self.rows = rows
+        # Contiguous numpy copy of ``rows``, built lazily by the first lookup that needs it
+        self.matrix: Any = None
+
+
+class ResponseCache:
+    """
+    Two-tier cache for chat completion contents.
+
+    Tier 1 is an exact match on a hash of the full request. Tier 2, enabled by
+    setting ``similarity_threshold``, compares prompt embeddings and returns a
+    cached completion when the cosine similarity is at or above the threshold.
+    Semantic matches are only considered between requests that share the same
+    model, generation parameters and ``scope``. Callers that build prompts from
+    templates pass the template and its fixed fields as the scope and embed only
+    the variable text, so the shared template does not inflate similarity.
+
+    When ``path`` is given, exact matches are also written to a SQLite database
+    and looked up there on a memory miss, so completions survive restarts and
+    are shared by every process using the same file.
+    """
+
+    DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return the default SQLite file for the persistent tier."""
+        return Path.home() / ".cache" / "beetune" / "responses.sqlite3"
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 3600,
+        max_entries: int = 1024,
+        similarity_threshold: Optional[float] = None,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            ttl: Seconds an entry stays valid. None disables expiry.
+            max_entries: Maximum number of cached completions (LRU eviction)
+            similarity_threshold: Minimum cosine similarity for a semantic hit.
+                None disables the embedding tier.
+            embedding_model: Model used to embed prompts for the semantic tier
+            path: SQLite file for the persistent exact-match tier (e.g.
+                ``ResponseCache.default_path()``). None keeps the cache in memory.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self._entries: "OrderedDict[str, Tuple[float, str, str, Optional[List[float]]]]" = (
+            OrderedDict()
+        )
+        # Vectors by namespace, and lazily built snapshots of them for lookups
+        self._vectors: Dict[str, Dict[str, Tuple[float, List[float]]]] = {}
+        self._snapshots: Dict[str, _SemanticSnapshot] = {}
+        self._next_sweep = time.monotonic() + _SWEEP_INTERVAL
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = self._open_db(Path(path).expanduser())
+
+    def _open_db(self, path: Path) -> sqlite3.Connection:
+        """Open the persistent tier, creating it if needed and dropping expired rows."""
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Cached completions may quote private documents: keep the file owner-only.
+        # SQLite gives the -wal and -shm files the same permissions.
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, content TEXT NOT NULL)"
+        )
+        if self.ttl is not None:
+            db.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl,))
+        return db
+
+    @staticmethod
+    def _namespace(request: Dict[str, Any], scope: str = "") -> str:
+        """Hash the scope and every request parameter except the messages."""
+        params = {k: v for k, v in request.items() if k != "messages"}
+        blob = json.dumps([scope, params], sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build the exact-match cache key for a chat completion request."""
+        blob = json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(blob).hexdigest()
+
+    @staticmethod
+    def prompt_of(request: Dict[str, Any]) -> str:
+        """Return the text that is embedded for semantic lookups."""
+        return "\n".join(str(message.get("content", "")) for message in request["messages"])
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> List[float]:
+        """Scale an embedding to unit length so dot products are cosines."""
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        return [x / norm for x in embedding]
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+    def _store(
+        self,
+        key: str,
+        stored_at: float,
+        namespace: str,
+        content: str,
+        vector: Optional[List[float]],
+    ) -> None:
+        """Insert or replace an in-memory entry. Caller holds the lock."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (stored_at, namespace, content, vector)
+        if vector is not None:
+            self._vectors.setdefault(namespace, {})[key] = (stored_at, vector)
+            self._snapshots.pop(namespace, None)
+
+    def _remove(self, key: str) -> None:
+        """Drop an in-memory entry and its vector, if any. Caller holds the lock."""
+        _, namespace, _, vector = self._entries.pop(key)
+        if vector is not None:
+            vectors = self._vectors[namespace]
+            del vectors[key]
+            if not vectors:
+                del self._vectors[namespace]
+            self._snapshots.pop(namespace, None)
+
+    def _sweep(self) -> None:
+        """Drop every expired in-memory entry. Caller holds the lock."""
+        for key in [k for k, entry in self._entries.items() if self._expired(entry[0])]:
+            self._remove(key)
+
+    def _snapshot(self, namespace: str) -> Optional[_SemanticSnapshot]:
+        """Return the current vectors of a namespace. Caller holds the lock."""
+        snapshot = self._snapshots.get(namespace)
+        if snapshot is None:
+            vectors = self._vectors.get(namespace)
+            if not vectors:
+                return None
+            stored_at, rows = zip(*vectors.values())
+            snapshot = _SemanticSnapshot(tuple(vectors), stored_at, rows)
+            self._snapshots[namespace] = snapshot
+        return snapshot
+
+    def _best_match(
+        self, snapshot: _SemanticSnapshot, query: List[float], threshold: float
+    ) -> Optional[Tuple[str, float]]:
+        """Return the most similar live key and its ``stored_at``, scored without the lock."""
+        now = time.monotonic()
+        live = [self.ttl is None or now - t <= self.ttl for t in snapshot.stored_at]
+        np = _numpy()
+        if np is not None:
+            if snapshot.matrix is None:
+                snapshot.matrix = np.asarray(snapshot.rows, dtype=np.float32)
+            scores = snapshot.matrix @ np.asarray(query, dtype=np.float32)
+            scores[~np.asarray(live)] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] < threshold:
+                return None
+        else:
+            best, best_score = -1, threshold
+            for i, row in enumerate(snapshot.rows):
+                if live[i]:
+                    score = sum(map(operator.mul, query, row))
+                    if score >= best_score:
+                        best, best_score = i, score
+            if best < 0:
+                return None
+        return snapshot.keys[best], snapshot.stored_at[best]
+
+    def get(
+        self,
+        request: Dict[str, Any],
+        embedding: Optional[Sequence[float]] = None,
+        scope: str = "",
+    ) -> Optional[str]:
+        """
+        Look up a cached completion for a request.
+
+        Args:
+            request: Chat completion keyword arguments
+            embedding: Prompt embedding, used for the semantic tier if enabled
+            scope: Semantic matches are limited to entries stored with this scope
+
+        Returns:
+            Cached completion content, or None on a miss
+        """
+        key = self.make_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    return entry[2]
+                self._remove(key)
+
+            if self._db is not None:
+                content = self._get_persisted(self._db, key, request)
+                if content is not None:
+                    return content
+
+            if embedding is None or self.similarity_threshold is None:
+                return None
+
+            snapshot = self._snapshot(self._namespace(request, scope))
+            if snapshot is None:
+                return None
+
+        match = self._best_match(snapshot, self._normalize(embedding), self.similarity_threshold)
+        if match is None:
+            return None
+        best_key, stored_at = match
+        with self._lock:
+            # The entry may have been replaced or evicted while scoring
+            entry = self._entries.get(best_key)
+            if entry is None or entry[0] != stored_at:
+                return None
+            self._entries.move_to_end(best_key)
+            return entry[2]
+
+    def _get_persisted(
+        self, db: sqlite3.Connection, key: str, request: Dict[str, Any]
+    ) -> Optional[str]:
+        """Look up an exact match in the persistent tier. Caller holds the lock."""
+        row = db.execute(
+            "SELECT stored_at, content FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, content = row
+        age = time.time() - stored_at
+        if self.ttl is not None and age > self.ttl:
+            db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+        # Promote into memory, keeping the entry's original age for expiry
+        self._store(key, time.monotonic() - age, self._namespace(request), content, None)
+        self._evict()
+        return content
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond ``max_entries``. Caller holds the lock."""
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def set(
+        self,
+        request: Dict[str, Any],
+        content: str,
+        embedding: Optional[Sequence[float]] = None,
+        scope: str = "",
+    ) -> None:
+        """Store a completion for a request, semantically matchable within ``scope``."""
+        key = self.make_key(request)
+        vector = self._normalize(embedding) if embedding is not None else None
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep()
+                self._next_sweep = now + _SWEEP_INTERVAL
+            self._store(key, now, self._namespace(request, scope), content, vector)
+            self._evict()
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, stored_at, content) VALUES (?, ?, ?)",
+                    (key, time.time(), content),
+                )
+
+    def clear(self) -> None:
+        """Drop every cached completion, including persisted ones."""
+        with self._lock:
+            self._entries.clear()
+            self._vectors.clear()
+            self._snapshots.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the persistent tier, if any. The in-memory tier stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,22 +5,149 @@ Provides AI-powered analysis of text to extract keywords, suggest improvements,
 and other relevant information.
 """
 
+import asyncio
+import atexit
+import importlib.util
 import logging
-from typing import Dict, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from openai import OpenAI
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from ..prompts import gen_analysis, gen_suggestions
-from ..utils import OpenAIError
+from ..utils import OpenAIError, serialization
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# One ``key: value`` pair per line, split at the first colon
+_KEY_VALUE_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
+
+# A line holding only a common résumé section title, optionally followed by a colon
+_SECTION_HEADER_RE = re.compile(
+    r"^[ \t]*((?:professional |work |technical |relevant )?"
+    r"(?:summary|profile|objective|experience|employment|education|skills|projects"
+    r"|certifications|awards|publications|volunteering|languages|interests)"
+    r"(?: history)?)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Semantic cache scope (prompt template and its fixed fields) and the variable
+# text that is embedded for similarity lookups
+_Semantic = Tuple[str, str]
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True for API failures worth retrying; see ``_parallel.RETRYABLE_ERRORS``."""
+    # Imported here so that importing beetune does not load the OpenAI SDK
+    from ._parallel import RETRYABLE_ERRORS
+
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+# Transient failures are retried in-process before surfacing as OpenAIError
+_chat_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(min=1, max=30),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+
+# HTTP/2 requires the optional h2 package (``pip install beetune[fast]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared (OpenAI, AsyncOpenAI) client pairs keyed by (api_key, base_url)
+_shared_clients: Dict[Tuple[str, Optional[str]], Tuple[Any, Any]] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_clients(api_key: str, base_url: Optional[str] = None) -> Tuple[Any, Any]:
+    """
+    Return the shared (OpenAI, AsyncOpenAI) client pair for a credential set.
+
+    Analyzers created with the same API key and endpoint reuse the same clients
+    and therefore the same HTTP connection pools, so keep-alive connections
+    survive across analyzer instances instead of paying a new TCP/TLS
+    handshake each time. Connections use HTTP/2 when ``h2`` is installed.
+    """
+    key = (api_key, base_url or None)
+    clients = _shared_clients.get(key)
+    if clients is None:
+        # Imported here so that importing beetune does not load the OpenAI SDK
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+        with _shared_clients_lock:
+            clients = _shared_clients.get(key)
+            if clients is None:
+                # The SDK's default HTTP clients keep its timeouts and pool limits;
+                # HTTP/2 multiplexes concurrent requests over one connection.
+                # SDK retries are off: _chat_retry is the only retry layer.
+                clients = (
+                    OpenAI(
+                        api_key=api_key,
+                        base_url=base_url or None,
+                        max_retries=0,
+                        http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE),
+                    ),
+                    AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=base_url or None,
+                        max_retries=0,
+                        http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE),
+                    ),
+                )
+                _shared_clients[key] = clients
+    return clients
+
+
+async def _close_async_clients(aclients: Sequence[Any]) -> None:
+    """Close async clients, ignoring pools bound to an event loop that is gone."""
+    for aclient in aclients:
+        try:
+            await aclient.close()
+        except RuntimeError as e:
+            logger.debug("Could not close async client: %s", e)
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """Close the connection pools of the shared synchronous and async clients."""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client, _ in clients:
+        client.close()
+
+    aclients = [aclient for _, aclient in clients]
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_close_async_clients(aclients))
+    else:
+        # asyncio.run() cannot nest; the pools are released with the running loop
+        logger.debug("Event loop running, leaving %d async clients open", len(aclients))
+
 
 class TextAnalyzer:
     """AI-powered text analyzer."""
 
+    # Batch API settings
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+    # Maximum number of inputs accepted by a single embeddings request
+    EMBEDDING_BATCH_SIZE = 2048
+
     def __init__(
-        self, openai_api_key: str, default_model: str = "gpt-4o", base_url: Optional[str] = None
+        self,
+        openai_api_key: str,
+        default_model: str = "gpt-4o",
+        base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the text analyzer with OpenAI-compatible API credentials.
@@ -29,12 +156,166 @@ class TextAnalyzer:
             openai_api_key: API key for the AI provider
             default_model: Default model to use
             base_url: Custom API endpoint (for Ollama, custom providers, etc.)
+            cache: Optional response cache shared between calls (disabled if None)
         """
-        if base_url:
-            self.client = OpenAI(api_key=openai_api_key, base_url=base_url)
-        else:
-            self.client = OpenAI(api_key=openai_api_key)
+        self.client, self.aclient = get_shared_clients(openai_api_key, base_url)
         self.default_model = default_model
+        self.cache = cache
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed a prompt for the semantic cache tier, if it is enabled."""
+        if self.cache is None or self.cache.similarity_threshold is None:
+            return None
+        response = self.client.embeddings.create(model=self.cache.embedding_model, input=text)
+        return list(response.data[0].embedding)
+
+    async def _embed_async(self, text: str) -> Optional[List[float]]:
+        """Asynchronous variant of :meth:`_embed`."""
+        if self.cache is None or self.cache.similarity_threshold is None:
+            return None
+        response = await self.aclient.embeddings.create(
+            model=self.cache.embedding_model, input=text
+        )
+        return list(response.data[0].embedding)
+
+    def _embed_many(self, texts: Sequence[str]) -> Optional[List[List[float]]]:
+        """Embed many prompts for the semantic cache tier with as few requests as possible."""
+        if self.cache is None or self.cache.similarity_threshold is None:
+            return None
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), self.EMBEDDING_BATCH_SIZE):
+            chunk = list(texts[start : start + self.EMBEDDING_BATCH_SIZE])
+            response = self.client.embeddings.create(model=self.cache.embedding_model, input=chunk)
+            data = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(list(item.embedding) for item in data)
+        return embeddings
+
+    def _store_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        contents: Sequence[Union[Optional[str], BaseException]],
+        semantics: Sequence[_Semantic],
+    ) -> None:
+        """Cache the successful completions of a bulk run."""
+        if self.cache is None:
+            return
+        completed = [
+            (request, content, semantic)
+            for request, content, semantic in zip(requests, contents, semantics)
+            if isinstance(content, str)
+        ]
+        if not completed:
+            return
+        try:
+            embeddings = self._embed_many([text for _, _, (_, text) in completed])
+        except Exception as e:
+            logger.warning("Failed to embed prompts for the response cache: %s", e)
+            embeddings = None
+        for i, (request, content, (scope, _)) in enumerate(completed):
+            self.cache.set(request, content, embeddings[i] if embeddings else None, scope)
+
+    @_chat_retry
+    def _chat(self, **kwargs: Any) -> Any:
+        """Create a chat completion, retrying transient API failures."""
+        return self.client.chat.completions.create(**kwargs)
+
+    @_chat_retry
+    async def _chat_async(self, **kwargs: Any) -> Any:
+        """Asynchronous variant of :meth:`_chat`."""
+        return await self.aclient.chat.completions.create(**kwargs)
+
+    def _cached_chat(self, request: Dict[str, Any], semantic: _Semantic) -> Optional[str]:
+        """Return completion content for a request, consulting the cache first."""
+        if self.cache is None:
+            response = self._chat(**request)
+            return response.choices[0].message.content
+
+        scope, text = semantic
+        embedding = None
+        content = self.cache.get(request)
+        if content is None:
+            embedding = self._embed(text)
+            content = self.cache.get(request, embedding, scope)
+        if content is not None:
+            logger.debug("Serving OpenAI response from cache")
+            return content
+
+        response = self._chat(**request)
+        content = response.choices[0].message.content
+        if content is not None:
+            self.cache.set(request, content, embedding, scope)
+        return content
+
+    async def _cached_chat_async(
+        self, request: Dict[str, Any], semantic: _Semantic
+    ) -> Optional[str]:
+        """Asynchronous variant of :meth:`_cached_chat`."""
+        if self.cache is None:
+            response = await self._chat_async(**request)
+            return response.choices[0].message.content
+
+        scope, text = semantic
+        embedding = None
+        content = self.cache.get(request)
+        if content is None:
+            embedding = await self._embed_async(text)
+            content = self.cache.get(request, embedding, scope)
+        if content is not None:
+            logger.debug("Serving OpenAI response from cache")
+            return content
+
+        response = await self._chat_async(**request)
+        content = response.choices[0].message.content
+        if content is not None:
+            self.cache.set(request, content, embedding, scope)
+        return content
+
+    @staticmethod
+    def _analysis_request(text: str, model: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for an analysis request."""
+        return {
+            "model": model,
+            "messages": [{"role": "user", "content": gen_analysis(text)}],
+            "max_tokens": 300,
+            "temperature": 0.3,
+        }
+
+    @staticmethod
+    def _suggestions_request(text: str, goal: str, model: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for a suggestions request."""
+        return {
+            "model": model,
+            "messages": [{"role": "user", "content": gen_suggestions(text, goal)}],
+            "max_tokens": 500,
+            "temperature": 0.5,
+        }
+
+    @staticmethod
+    def _analysis_semantic(text: str) -> _Semantic:
+        """Return the semantic cache scope and embedded text of an analysis request."""
+        return "analysis", text
+
+    @staticmethod
+    def _suggestions_semantic(text: str, goal: str) -> _Semantic:
+        """Return the semantic cache scope and embedded text of a suggestions request."""
+        # Only suggestions for the same goal may stand in for one another
+        return f"suggestions\0{goal}", text
+
+    @staticmethod
+    def _parse_analysis(content: Optional[str]) -> Dict[str, str]:
+        """Parse a ``key: value`` formatted analysis response."""
+        if content is None:
+            raise OpenAIError("No content in OpenAI response for analysis")
+        # A more robust parsing logic would be needed here in a real application
+        # For now, we'll assume the model returns a simple key: value format.
+        return {key.strip().lower(): value.strip() for key, value in _KEY_VALUE_RE.findall(content)}
+
+    @staticmethod
+    def _parse_suggestions(content: Optional[str]) -> str:
+        """Validate and normalize a suggestions response."""
+        if content is None:
+            raise OpenAIError("No content in OpenAI response for suggestions")
+        return content.strip()
 
     def analyze(self, text: str, model: Optional[str] = None) -> Dict[str, str]:
         """
@@ -51,34 +332,19 @@ class TextAnalyzer:
             OpenAIError: If the API call fails
         """
         model = model or self.default_model
-        result = {}
 
         try:
             # Extract keywords
             logger.debug("Sending request to OpenAI for analysis...")
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": gen_analysis(text)}],
-                max_tokens=300,
-                temperature=0.3,
+            content = self._cached_chat(
+                self._analysis_request(text, model), self._analysis_semantic(text)
             )
-
-            content = response.choices[0].message.content
-            if content is None:
-                raise OpenAIError("No content in OpenAI response for analysis")
-            # A more robust parsing logic would be needed here in a real application
-            # For now, we'll assume the model returns a simple key: value format.
-            for line in content.split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    result[key.strip().lower()] = value.strip()
+            return self._parse_analysis(content)
 
         except Exception as e:
-            logger.error(f"OpenAI API error during text analysis: {str(e)}")
+            logger.error("OpenAI API error during text analysis: %s", e)
             raise OpenAIError("Failed to analyze text", str(e))
 
-        return result
-
     def suggest_improvements(self, text: str, goal: str, model: Optional[str] = None) -> str:
         """
         Suggest improvements for a given text based on a goal.
@@ -98,19 +364,514 @@ class TextAnalyzer:
 
         try:
             logger.debug("Sending request to OpenAI for suggestions...")
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": gen_suggestions(text, goal)}],
-                max_tokens=500,
-                temperature=0.5,
+            content = self._cached_chat(
+                self._suggestions_request(text, goal, model),
+                self._suggestions_semantic(text, goal),
+            )
+            return self._parse_suggestions(content)
+
+        except Exception as e:
+            logger.error("OpenAI API error during suggestion generation: %s", e)
+            raise OpenAIError("Failed to generate suggestions", str(e))
+
+    def suggest_improvements_stream(
+        self, text: str, goal: str, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream improvement suggestions as they are generated.
+
+        Yields content deltas as soon as the model produces them, so callers
+        can start rendering before the full completion has arrived. Joining
+        the yielded chunks gives the same text as :meth:`suggest_improvements`
+        (before whitespace stripping).
+
+        Args:
+            text: The text to improve
+            goal: The goal for the improvement (e.g., "make it more concise")
+            model: OpenAI model to use (defaults to instance default)
+
+        Yields:
+            Chunks of the suggestions text
+
+        Raises:
+            OpenAIError: If the API call fails
+        """
+        model = model or self.default_model
+        request = self._suggestions_request(text, goal, model)
+
+        if self.cache is not None:
+            cached = self.cache.get(request)
+            if cached is not None:
+                logger.debug("Serving OpenAI response from cache")
+                yield cached
+                return
+
+        chunks = []
+        try:
+            logger.debug("Sending streaming request to OpenAI for suggestions...")
+            response = self._chat(**request, stream=True)
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+
+        except Exception as e:
+            logger.error("OpenAI API error during suggestion streaming: %s", e)
+            raise OpenAIError("Failed to generate suggestions", str(e))
+
+        if self.cache is not None and chunks:
+            self.cache.set(request, "".join(chunks))
+
+    async def analyze_async(self, text: str, model: Optional[str] = None) -> Dict[str, str]:
+        """Asynchronous variant of :meth:`analyze` using the ``AsyncOpenAI`` client."""
+        model = model or self.default_model
+
+        try:
+            logger.debug("Sending async request to OpenAI for analysis...")
+            content = await self._cached_chat_async(
+                self._analysis_request(text, model), self._analysis_semantic(text)
             )
+            return self._parse_analysis(content)
+
+        except Exception as e:
+            logger.error("OpenAI API error during text analysis: %s", e)
+            raise OpenAIError("Failed to analyze text", str(e))
 
-            content = response.choices[0].message.content
-            if content is None:
-                raise OpenAIError("No content in OpenAI response for suggestions")
+    async def suggest_improvements_async(
+        self, text: str, goal: str, model: Optional[str] = None
+    ) -> str:
+        """Asynchronous variant of :meth:`suggest_improvements`."""
+        model = model or self.default_model
 
-            return content.strip()
+        try:
+            logger.debug("Sending async request to OpenAI for suggestions...")
+            content = await self._cached_chat_async(
+                self._suggestions_request(text, goal, model),
+                self._suggestions_semantic(text, goal),
+            )
+            return self._parse_suggestions(content)
 
         except Exception as e:
-            logger.error(f"OpenAI API error during suggestion generation: {str(e)}")
+            logger.error("OpenAI API error during suggestion generation: %s", e)
             raise OpenAIError("Failed to generate suggestions", str(e))
+
+    @staticmethod
+    def _split_sections(text: str) -> List[Tuple[str, str]]:
+        """
+        Split a résumé into ``(title, section text)`` pairs at common section headers.
+
+        Text before the first header (usually name and contact details) is titled
+        ``"Header"``; a résumé without recognizable headers is one ``"Resume"``
+        section. Each section keeps its header line for context.
+        """
+        starts = [(m.start(), m.group(1).strip()) for m in _SECTION_HEADER_RE.finditer(text)]
+        if not starts:
+            return [("Resume", text.strip())] if text.strip() else []
+
+        sections = []
+        preamble = text[: starts[0][0]].strip()
+        if preamble:
+            sections.append(("Header", preamble))
+        ends = [start for start, _ in starts[1:]] + [len(text)]
+        for (start, title), end in zip(starts, ends):
+            sections.append((title, text[start:end].strip()))
+        return sections
+
+    def suggest_improvements_by_section(
+        self, text: str, goal: str, model: Optional[str] = None, max_workers: int = 6
+    ) -> List[Tuple[str, str]]:
+        """
+        Suggest improvements for each section of a résumé concurrently.
+
+        Sections are split at common headers (experience, education, skills, ...)
+        and each is sent as its own request, so latency is that of the slowest
+        section rather than the whole document, and unchanged sections are
+        answered from the response cache.
+
+        Args:
+            text: The résumé text to improve
+            goal: The goal for the improvement
+            model: OpenAI model to use (defaults to instance default)
+            max_workers: Maximum number of sections requested at once
+
+        Returns:
+            ``(section title, suggestions)`` pairs in document order
+
+        Raises:
+            OpenAIError: If any API call fails
+        """
+        sections = self._split_sections(text)
+        if not sections:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sections))) as executor:
+            suggestions = list(
+                executor.map(
+                    lambda section: self.suggest_improvements(section, goal, model),
+                    [section for _, section in sections],
+                )
+            )
+        return [(title, tips) for (title, _), tips in zip(sections, suggestions)]
+
+    async def analyze_and_suggest_async(
+        self, text: str, goal: str, model: Optional[str] = None
+    ) -> Tuple[Dict[str, str], str]:
+        """
+        Run analysis and suggestion generation concurrently.
+
+        Both requests are independent, so they are dispatched together and the
+        total latency is that of the slower call rather than the sum of both.
+
+        Args:
+            text: The text to analyze and improve
+            goal: The goal for the improvement
+            model: OpenAI model to use (defaults to instance default)
+
+        Returns:
+            Tuple of (analysis dictionary, suggestions string)
+
+        Raises:
+            OpenAIError: If either API call fails
+        """
+        analysis, suggestions = await asyncio.gather(
+            self.analyze_async(text, model),
+            self.suggest_improvements_async(text, goal, model),
+            return_exceptions=True,
+        )
+        for outcome in (analysis, suggestions):
+            if isinstance(outcome, OpenAIError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                raise OpenAIError("Failed to analyze text", str(outcome))
+        return analysis, suggestions  # type: ignore[return-value]
+
+    def analyze_and_suggest(
+        self, text: str, goal: str, model: Optional[str] = None
+    ) -> Tuple[Dict[str, str], str]:
+        """
+        Synchronous counterpart of :meth:`analyze_and_suggest_async`.
+
+        The two blocking calls are issued from a small thread pool so that the
+        shared ``OpenAI`` client is reused and no event loop is required.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            analysis = executor.submit(self.analyze, text, model)
+            suggestions = executor.submit(self.suggest_improvements, text, goal, model)
+            return analysis.result(), suggestions.result()
+
+    def submit_batch(self, requests: Sequence[Dict[str, Any]]) -> str:
+        """
+        Submit chat completion requests to the OpenAI Batch API.
+
+        Batch jobs are billed at a discount and draw from a separate rate-limit
+        pool, at the cost of completing asynchronously within 24 hours.
+
+        Args:
+            requests: Chat completion keyword arguments, one per request
+
+        Returns:
+            The batch ID; request ``i`` is tracked under ``custom_id`` ``str(i)``
+
+        Raises:
+            OpenAIError: If the upload or batch creation fails
+        """
+        lines = [
+            serialization.dumps(
+                {"custom_id": str(i), "method": "POST", "url": self.BATCH_ENDPOINT, "body": body}
+            )
+            for i, body in enumerate(requests)
+        ]
+
+        try:
+            logger.debug("Submitting batch of %d requests to OpenAI...", len(lines))
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            return str(batch.id)
+
+        except Exception as e:
+            logger.error("OpenAI API error during batch submission: %s", e)
+            raise OpenAIError("Failed to submit batch", str(e))
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Poll a batch until it finishes and return its completions.
+
+        Args:
+            batch_id: ID returned by :meth:`submit_batch`
+            poll_interval: Initial delay between status checks, in seconds
+            max_poll_interval: Upper bound for the exponential backoff
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            Mapping of ``custom_id`` to completion content (None for failed requests)
+
+        Raises:
+            OpenAIError: If the batch does not complete successfully
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            while batch.status not in self.BATCH_TERMINAL_STATUSES:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise OpenAIError("Batch did not complete in time", f"Batch {batch_id}")
+                logger.debug("Batch %s is %s, polling again...", batch_id, batch.status)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+                batch = self.client.batches.retrieve(batch_id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise OpenAIError("Batch did not complete", f"Batch {batch_id}: {batch.status}")
+
+            output = self.client.files.content(batch.output_file_id).content
+
+        except OpenAIError:
+            raise
+        except Exception as e:
+            logger.error("OpenAI API error while waiting for batch: %s", e)
+            raise OpenAIError("Failed to retrieve batch results", str(e))
+
+        results: Dict[str, Optional[str]] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = serialization.loads(line)
+            response = record.get("response") or {}
+            content = None
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = content
+        return results
+
+    def analyze_batch(
+        self, texts: Sequence[str], model: Optional[str] = None, **wait_kwargs: Any
+    ) -> List[Dict[str, str]]:
+        """
+        Analyze many texts through the Batch API.
+
+        Args:
+            texts: The texts to analyze
+            model: OpenAI model to use (defaults to instance default)
+            **wait_kwargs: Polling options forwarded to :meth:`wait_for_batch`
+
+        Returns:
+            Analysis dictionaries in the same order as ``texts``
+
+        Raises:
+            OpenAIError: If the batch or any individual request fails
+        """
+        model = model or self.default_model
+        requests = [self._analysis_request(text, model) for text in texts]
+        results = self.wait_for_batch(self.submit_batch(requests), **wait_kwargs)
+        contents = [results.get(str(i)) for i in range(len(texts))]
+        self._store_many(requests, contents, [self._analysis_semantic(t) for t in texts])
+        return [self._parse_analysis(content) for content in contents]
+
+    def suggest_improvements_batch(
+        self,
+        items: Sequence[Tuple[str, str]],
+        model: Optional[str] = None,
+        **wait_kwargs: Any,
+    ) -> List[str]:
+        """
+        Generate suggestions for many ``(text, goal)`` pairs through the Batch API.
+
+        Args:
+            items: Pairs of text to improve and improvement goal
+            model: OpenAI model to use (defaults to instance default)
+            **wait_kwargs: Polling options forwarded to :meth:`wait_for_batch`
+
+        Returns:
+            Suggestion strings in the same order as ``items``
+
+        Raises:
+            OpenAIError: If the batch or any individual request fails
+        """
+        model = model or self.default_model
+        requests = [self._suggestions_request(text, goal, model) for text, goal in items]
+        results = self.wait_for_batch(self.submit_batch(requests), **wait_kwargs)
+        contents = [results.get(str(i)) for i in range(len(items))]
+        self._store_many(requests, contents, [self._suggestions_semantic(t, g) for t, g in items])
+        return [self._parse_suggestions(content) for content in contents]
+
+    def _run_many_sync(
+        self, requests: Sequence[Dict[str, Any]], **options: Any
+    ) -> List[Union[Optional[str], BaseException]]:
+        """Run :func:`run_many` from synchronous code.
+
+        ``asyncio.run`` closes its event loop on exit, so a short-lived async
+        client is used instead of ``self.aclient``, whose connection pool must
+        stay bound to the caller's loop.
+        """
+
+        from openai import AsyncOpenAI
+
+        from ._parallel import run_many
+
+        async def _run() -> List[Union[Optional[str], BaseException]]:
+            # run_many retries failed requests itself
+            async with AsyncOpenAI(
+                api_key=self.aclient.api_key, base_url=self.aclient.base_url, max_retries=0
+            ) as aclient:
+                return await run_many(aclient, requests, **options)
+
+        return asyncio.run(_run())
+
+    @staticmethod
+    def _unwrap_suggestions(outcomes: Sequence[Union[Optional[str], BaseException]]) -> List[str]:
+        """Convert :func:`run_many` outcomes to suggestions, raising on failures."""
+        suggestions = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise OpenAIError("Failed to generate suggestions", str(outcome))
+            suggestions.append(TextAnalyzer._parse_suggestions(outcome))
+        return suggestions
+
+    @staticmethod
+    def _unwrap_analyses(
+        outcomes: Sequence[Union[Optional[str], BaseException]],
+    ) -> List[Dict[str, str]]:
+        """Convert :func:`run_many` outcomes to analyses, raising on failures."""
+        analyses = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise OpenAIError("Failed to analyze text", str(outcome))
+            analyses.append(TextAnalyzer._parse_analysis(outcome))
+        return analyses
+
+    async def analyze_concurrent_async(
+        self,
+        texts: Sequence[str],
+        model: Optional[str] = None,
+        num_concurrent: int = 10,
+        max_rpm: float = 500,
+        max_tpm: float = 200_000,
+    ) -> List[Dict[str, str]]:
+        """
+        Analyze many texts concurrently.
+
+        Requests are spread over ``num_concurrent`` workers and throttled to the
+        given requests-per-minute and tokens-per-minute limits; rate-limit and
+        transient errors are retried.
+
+        Args:
+            texts: The texts to analyze
+            model: OpenAI model to use (defaults to instance default)
+            num_concurrent: Maximum number of in-flight requests
+            max_rpm: Requests-per-minute budget
+            max_tpm: Tokens-per-minute budget
+
+        Returns:
+            Analysis dictionaries in the same order as ``texts``
+
+        Raises:
+            OpenAIError: If any request ultimately fails
+        """
+        from ._parallel import run_many
+
+        model = model or self.default_model
+        requests = [self._analysis_request(text, model) for text in texts]
+        outcomes = await run_many(
+            self.aclient,
+            requests,
+            num_concurrent=num_concurrent,
+            max_rpm=max_rpm,
+            max_tpm=max_tpm,
+        )
+        loop = asyncio.get_running_loop()
+        semantics = [self._analysis_semantic(text) for text in texts]
+        await loop.run_in_executor(None, self._store_many, requests, outcomes, semantics)
+        return self._unwrap_analyses(outcomes)
+
+    def analyze_concurrent(
+        self,
+        texts: Sequence[str],
+        model: Optional[str] = None,
+        num_concurrent: int = 10,
+        max_rpm: float = 500,
+        max_tpm: float = 200_000,
+    ) -> List[Dict[str, str]]:
+        """Synchronous counterpart of :meth:`analyze_concurrent_async`."""
+        model = model or self.default_model
+        requests = [self._analysis_request(text, model) for text in texts]
+        outcomes = self._run_many_sync(
+            requests, num_concurrent=num_concurrent, max_rpm=max_rpm, max_tpm=max_tpm
+        )
+        self._store_many(requests, outcomes, [self._analysis_semantic(t) for t in texts])
+        return self._unwrap_analyses(outcomes)
+
+    async def suggest_improvements_concurrent_async(
+        self,
+        items: Sequence[Tuple[str, str]],
+        model: Optional[str] = None,
+        num_concurrent: int = 10,
+        max_rpm: float = 500,
+        max_tpm: float = 200_000,
+    ) -> List[str]:
+        """
+        Generate suggestions for many ``(text, goal)`` pairs concurrently.
+
+        Requests are spread over ``num_concurrent`` workers and throttled to the
+        given requests-per-minute and tokens-per-minute limits; rate-limit and
+        transient errors are retried.
+
+        Args:
+            items: Pairs of text to improve and improvement goal
+            model: OpenAI model to use (defaults to instance default)
+            num_concurrent: Maximum number of in-flight requests
+            max_rpm: Requests-per-minute budget
+            max_tpm: Tokens-per-minute budget
+
+        Returns:
+            Suggestion strings in the same order as ``items``
+
+        Raises:
+            OpenAIError: If any request ultimately fails
+        """
+        from ._parallel import run_many
+
+        model = model or self.default_model
+        requests = [self._suggestions_request(text, goal, model) for text, goal in items]
+        outcomes = await run_many(
+            self.aclient,
+            requests,
+            num_concurrent=num_concurrent,
+            max_rpm=max_rpm,
+            max_tpm=max_tpm,
+        )
+        loop = asyncio.get_running_loop()
+        semantics = [self._suggestions_semantic(text, goal) for text, goal in items]
+        await loop.run_in_executor(None, self._store_many, requests, outcomes, semantics)
+        return self._unwrap_suggestions(outcomes)
+
+    def suggest_improvements_concurrent(
+        self,
+        items: Sequence[Tuple[str, str]],
+        model: Optional[str] = None,
+        num_concurrent: int = 10,
+        max_rpm: float = 500,
+        max_tpm: float = 200_000,
+    ) -> List[str]:
+        """Synchronous counterpart of :meth:`suggest_improvements_concurrent_async`."""
+        model = model or self.default_model
+        requests = [self._suggestions_request(text, goal, model) for text, goal in items]
+        outcomes = self._run_many_sync(
+            requests, num_concurrent=num_concurrent, max_rpm=max_rpm, max_tpm=max_tpm
+        )
+        self._store_many(requests, outcomes, [self._suggestions_semantic(t, g) for t, g in items])
+        return self._unwrap_suggestions(outcomes)
@@ -7,6 +7,7 @@ to analyze text and generate improvements.
 
 from .generators import (
     OutputFormat,
+    PromptTemplates,
     PromptTone,
     gen_analysis,
     gen_suggestions,
@@ -15,6 +16,7 @@ from .generators import (
 __all__ = [
     "PromptTone",
     "OutputFormat",
+    "PromptTemplates",
     "gen_analysis",
     "gen_suggestions",
 ]
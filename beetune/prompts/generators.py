@@ -1,4 +1,6 @@
+import functools
 from enum import Enum
+from typing import Dict, Tuple
 
 
 class PromptTone(Enum):
@@ -9,6 +11,10 @@ class PromptTone(Enum):
     ENTHUSIASTIC = "enthusiastic"
     CONCISE = "concise"
 
+    # Members are singletons, so identity hashing is consistent with equality
+    # and avoids Enum's Python-level __hash__ on every prompt table lookup
+    __hash__ = object.__hash__
+
 
 class OutputFormat(Enum):
     """Available output format options."""
@@ -18,6 +24,8 @@ class OutputFormat(Enum):
     NUMBERED_LIST = "numbered_list"
     PARAGRAPH = "paragraph"
 
+    __hash__ = object.__hash__
+
 
 class PromptTemplates:
     """Enhanced prompt templates with parameterization support."""
@@ -37,26 +45,13 @@ class PromptTemplates:
     }
 
 
-def gen_analysis(
-    text: str,
-    tone: PromptTone = PromptTone.PROFESSIONAL,
-    output_format: OutputFormat = OutputFormat.BULLET_POINTS,
-) -> str:
-    """
-    Generate a prompt for analyzing a text.
-
-    Args:
-        text: The text to analyze
-        tone: The tone of the prompt (professional, casual, etc.)
-        output_format: How to format the output
-
-    Returns:
-        A well-structured prompt for text analysis
-    """
-    tone_modifier = PromptTemplates.TONE_MODIFIERS[tone]
-    format_instruction = PromptTemplates.FORMAT_INSTRUCTIONS[output_format]
+# Number of recently built prompts kept per generator. Prompts embed the full
+# input text, so the cache is bounded to keep memory predictable.
+PROMPT_CACHE_SIZE = 256
 
-    prompt = f"""{tone_modifier}
+# Static prompt bodies, built once at import time; only the variable
+# fields are substituted per call.
+_ANALYSIS_TEMPLATE = """{tone_modifier}
 
 Your task is to analyze the following text and extract key information. Focus on identifying:
 - Main topics and themes
@@ -75,9 +70,82 @@ Text:
 
 Extract the key information now:"""
 
-    return prompt
+_SUGGESTIONS_TEMPLATE = """{tone_modifier}
+
+You are analyzing a text to provide targeted improvement suggestions. Your analysis should focus on the following goal: {goal}.
+
+ANALYSIS APPROACH:
+1. Identify areas of the text that can be improved to meet the goal.
+2. Suggest specific, actionable improvements rather than generic advice.
+3. Consider both content improvements and formatting/presentation enhancements.
+
+IMPORTANT: Do not rewrite the text. Only provide specific, actionable suggestions for improvement.
+
+{format_instruction}
+
+Text:
+{text}
+
+Provide your improvement suggestions:"""
+
+
+# Templates with tone and format already applied for every combination, kept
+# as the fixed fragments between the per-call fields. A call then only
+# concatenates its own text around them instead of re-parsing the template.
+# The fields are split on a NUL character, which never occurs in the templates.
+_FIELD = "\0"
+
+_ANALYSIS_PROMPTS: Dict[Tuple[PromptTone, OutputFormat], Tuple[str, ...]] = {
+    (tone, output_format): tuple(
+        _ANALYSIS_TEMPLATE.format(
+            tone_modifier=PromptTemplates.TONE_MODIFIERS[tone],
+            format_instruction=PromptTemplates.FORMAT_INSTRUCTIONS[output_format],
+            text=_FIELD,
+        ).split(_FIELD)
+    )
+    for tone in PromptTone
+    for output_format in OutputFormat
+}
+
+_SUGGESTIONS_PROMPTS: Dict[Tuple[PromptTone, OutputFormat], Tuple[str, ...]] = {
+    (tone, output_format): tuple(
+        _SUGGESTIONS_TEMPLATE.format(
+            tone_modifier=PromptTemplates.TONE_MODIFIERS[tone],
+            format_instruction=PromptTemplates.FORMAT_INSTRUCTIONS[output_format],
+            goal=_FIELD,
+            text=_FIELD,
+        ).split(_FIELD)
+    )
+    for tone in PromptTone
+    for output_format in OutputFormat
+}
+
+
+@functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def gen_analysis(
+    text: str,
+    tone: PromptTone = PromptTone.PROFESSIONAL,
+    output_format: OutputFormat = OutputFormat.BULLET_POINTS,
+) -> str:
+    """
+    Generate a prompt for analyzing a text.
+
+    Results are memoized, so repeated requests for the same text reuse the
+    prompt built the first time.
+
+    Args:
+        text: The text to analyze
+        tone: The tone of the prompt (professional, casual, etc.)
+        output_format: How to format the output
 
+    Returns:
+        A well-structured prompt for text analysis
+    """
+    head, tail = _ANALYSIS_PROMPTS[tone, output_format]
+    return head + text + tail
 
+
+@functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
 def gen_suggestions(
     text: str,
     goal: str,
@@ -87,6 +155,8 @@ def gen_suggestions(
     """
     Generate a prompt for suggesting improvements to a text.
 
+    Results are memoized like :func:`gen_analysis`.
+
     Args:
         text: The text to improve
         goal: The improvement goal (e.g., "make it more concise")
@@ -96,25 +166,5 @@ def gen_suggestions(
     Returns:
         A well-structured prompt for improvement suggestions
     """
-    tone_modifier = PromptTemplates.TONE_MODIFIERS[tone]
-    format_instruction = PromptTemplates.FORMAT_INSTRUCTIONS[output_format]
-
-    prompt = f"""{tone_modifier}
-
-You are analyzing a text to provide targeted improvement suggestions. Your analysis should focus on the following goal: {goal}.
-
-ANALYSIS APPROACH:
-1. Identify areas of the text that can be improved to meet the goal.
-2. Suggest specific, actionable improvements rather than generic advice.
-3. Consider both content improvements and formatting/presentation enhancements.
-
-IMPORTANT: Do not rewrite the text. Only provide specific, actionable suggestions for improvement.
-
-{format_instruction}
-
-Text:
-{text}
-
-Provide your improvement suggestions:"""
-
-    return prompt
+    head, middle, tail = _SUGGESTIONS_PROMPTS[tone, output_format]
+    return head + goal + middle + text + tail
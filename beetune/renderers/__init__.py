@@ -5,7 +5,7 @@ This module provides tools for converting documents to professionally formatted
 LaTeX documents and compiling them to PDF.
 """
 
-from .document_styler import DocumentStyler, LaTeXStyle
+from .document_styler import DocumentStyler, LaTeXStyle, LaTeXTemplate
 from .latex_converter import UnifiedLatexConverter
 
-__all__ = ["DocumentStyler", "LaTeXStyle", "UnifiedLatexConverter"]
+__all__ = ["DocumentStyler", "LaTeXStyle", "LaTeXTemplate", "UnifiedLatexConverter"]
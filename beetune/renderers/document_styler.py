@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Dict, List, Tuple
 
 
 class LaTeXStyle(Enum):
@@ -10,6 +11,21 @@ class LaTeXStyle(Enum):
     MINIMAL = "minimal"
     ACADEMIC = "academic"
 
+    # Members are singletons, so identity hashing is consistent with equality
+    # and avoids Enum's Python-level __hash__ on every template lookup
+    __hash__ = object.__hash__
+
+
+@dataclass(frozen=True)
+class LaTeXTemplate:
+    """Preamble settings for one LaTeX style."""
+
+    documentclass: str
+    packages: Tuple[str, ...]
+    geometry: str
+    colors: str
+    section_format: str
+
 
 class DocumentStyler:
     """
@@ -17,10 +33,10 @@ class DocumentStyler:
     """
 
     # LaTeX templates for different styles
-    LATEX_TEMPLATES = {
-        LaTeXStyle.MODERN: {
-            "documentclass": r"\documentclass[11pt,a4paper]{article}",
-            "packages": [
+    LATEX_TEMPLATES: Dict[LaTeXStyle, LaTeXTemplate] = {
+        LaTeXStyle.MODERN: LaTeXTemplate(
+            documentclass=r"\documentclass[11pt,a4paper]{article}",
+            packages=(
                 r"\usepackage[utf8]{inputenc}",
                 r"\usepackage[T1]{fontenc}",
                 r"\usepackage{geometry}",
@@ -29,40 +45,41 @@ class DocumentStyler:
                 r"\usepackage{hyperref}",
                 r"\usepackage{xcolor}",
                 r"\usepackage{fontawesome5}",
-            ],
-            "geometry": r"\geometry{top=1in, bottom=1in, left=0.75in, right=0.75in}",
-            "colors": r"\definecolor{primarycolor}{RGB}{0, 102, 204}",
-            "section_format": r"\titleformat{\section}{\large\bfseries\color{primarycolor}}{}{0em}{}[\titlerule]",
-        },
-        LaTeXStyle.CLASSIC: {
-            "documentclass": r"\documentclass[11pt,a4paper]{article}",
-            "packages": [
+            ),
+            geometry=r"\geometry{top=1in, bottom=1in, left=0.75in, right=0.75in}",
+            colors=r"\definecolor{primarycolor}{RGB}{0, 102, 204}",
+            section_format=r"\titleformat{\section}{\large\bfseries\color{primarycolor}}{}{0em}{}[\titlerule]",
+        ),
+        LaTeXStyle.CLASSIC: LaTeXTemplate(
+            documentclass=r"\documentclass[11pt,a4paper]{article}",
+            packages=(
                 r"\usepackage[utf8]{inputenc}",
                 r"\usepackage[T1]{fontenc}",
                 r"\usepackage{geometry}",
                 r"\usepackage{enumitem}",
-            ],
-            "geometry": r"\geometry{top=1in, bottom=1in, left=1in, right=1in}",
-            "colors": "",
-            "section_format": "",
-        },
-        LaTeXStyle.MINIMAL: {
-            "documentclass": r"\documentclass[10pt,a4paper]{article}",
-            "packages": [
+            ),
+            geometry=r"\geometry{top=1in, bottom=1in, left=1in, right=1in}",
+            colors="",
+            section_format="",
+        ),
+        LaTeXStyle.MINIMAL: LaTeXTemplate(
+            documentclass=r"\documentclass[10pt,a4paper]{article}",
+            packages=(
                 r"\usepackage[utf8]{inputenc}",
                 r"\usepackage{geometry}",
                 r"\usepackage{enumitem}",
-            ],
-            "geometry": r"\geometry{top=0.75in, bottom=0.75in, left=0.75in, right=0.75in}",
-            "colors": "",
-            "section_format": r"\renewcommand{\section}[1]{\vspace{0.5em}\textbf{\large #1}\vspace{0.25em}\hrule\vspace{0.25em}]}",
-        },
+            ),
+            geometry=r"\geometry{top=0.75in, bottom=0.75in, left=0.75in, right=0.75in}",
+            colors="",
+            section_format=r"\renewcommand{\section}[1]{\vspace{0.5em}\textbf{\large #1}\vspace{0.25em}\hrule\vspace{0.25em}]}",
+        ),
     }
 
     @staticmethod
     def style_document(
         text: str,
         style: LaTeXStyle = LaTeXStyle.MODERN,
+        suggestions: str = "",
     ) -> str:
         """
         Format a complete document with LaTeX markup.
@@ -70,20 +87,19 @@ class DocumentStyler:
         Args:
             text: The original text
             style: The LaTeX style to use
+            suggestions: Improvement suggestions to embed as LaTeX comments
+                before the end of the document (omitted if empty)
 
         Returns:
             Complete LaTeX-formatted document
         """
-        # Generate LaTeX header
-        latex_content = [DocumentStyler.generate_latex_header(style)]
+        # Suggestions go in at build time, ahead of the closing line
+        if suggestions:
+            text += "\n% IMPROVEMENT SUGGESTIONS:" + "".join(
+                f"\n% {line}" for line in suggestions.splitlines()
+            )
 
-        # Add the text
-        latex_content.append(text)
-
-        # Close document
-        latex_content.append(r"\end{document}")
-
-        return "\n".join(latex_content)
+        return f"{_STYLE_HEADERS[style]}\n{text}\n\\end{{document}}"
 
     @staticmethod
     def generate_latex_header(style: LaTeXStyle = LaTeXStyle.MODERN) -> str:
@@ -96,39 +112,40 @@ class DocumentStyler:
         Returns:
             LaTeX header string
         """
-        template: Dict[str, Any] = DocumentStyler.LATEX_TEMPLATES[style]
+        return _STYLE_HEADERS[style]
+
+    @staticmethod
+    def _render_header(template: LaTeXTemplate) -> str:
+        """Render the header for one style template."""
+        # Colors and formatting are optional; each is followed by a blank line
+        styling = [
+            part
+            for value in (template.colors, template.section_format)
+            if value
+            for part in (value, "")
+        ]
 
         header_parts: List[str] = [
-            template["documentclass"],
+            template.documentclass,
+            "",
+            *template.packages,
+            "",
+            template.geometry,
+            "",
+            *styling,
+            # Document settings
+            r"\setlength{\parindent}{0pt}",
+            r"\setlength{\parskip}{0.5em}",
+            "",
+            r"\begin{document}",
             "",
         ]
-        # Add packages
-        header_parts.extend(template["packages"])
-        header_parts.extend(
-            [
-                "",
-                # Geometry
-                template["geometry"],
-                "",
-            ]
-        )
-
-        # Colors and formatting
-        if template["colors"]:
-            header_parts.extend([template["colors"], ""])
-
-        if template["section_format"]:
-            header_parts.extend([template["section_format"], ""])
-
-        # Document settings
-        header_parts.extend(
-            [
-                r"\setlength{\parindent}{0pt}",
-                r"\setlength{\parskip}{0.5em}",
-                "",
-                r"\begin{document}",
-                "",
-            ]
-        )
 
         return "\n".join(header_parts)
+
+
+# Headers are constant per style, so they are rendered once at import time
+_STYLE_HEADERS: Dict[LaTeXStyle, str] = {
+    style: DocumentStyler._render_header(template)
+    for style, template in DocumentStyler.LATEX_TEMPLATES.items()
+}
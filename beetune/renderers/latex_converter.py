@@ -1,15 +1,141 @@
 import base64
+import functools
+import hashlib
 import logging
 import os
 import re
 import subprocess
 import tempfile
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ..utils import serialization
+from ..utils.scratch import SCRATCH_DIR
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - depends on optional dependency
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_linear(pattern: str):
+    """Compile a pattern with RE2 when installed, falling back to ``re``.
+
+    RE2 matches in linear time, so spans such as ``.*`` cannot backtrack
+    catastrophically on large or adversarial documents. Only patterns without
+    lookarounds or backreferences may be passed here.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
+# Structural elements, package-dependent commands and package imports, matched
+# in a single scan. Each named group marks one element; \usepackage captures
+# its comma-separated package list, with or without options. The shared
+# leading backslash is factored out so the scan only tries the
+# alternatives at backslashes. The itemize option check is a lookahead so the
+# rest of the line stays available to later matches.
+_ELEMENT_RE = re.compile(
+    r"\\(?:"
+    r"(?P<documentclass>documentclass)"
+    r"|(?P<begin_document>begin{document})"
+    r"|(?P<end_document>end{document})"
+    r"|(?P<geometry>geometry\{)"
+    r"|(?P<xcolor>color\{|definecolor)"
+    r"|(?P<hyperref>href\{|url\{)"
+    r"|(?P<enumitem>begin{itemize}(?=.*\[.*\]))"
+    r"|(?P<usepackage>usepackage(?:\[[^\]]*\])?\s*\{(?P<packages>[^}]*)\})"
+    r")"
+)
+
+# Element groups recorded by offset (everything except package imports)
+_ELEMENT_GROUPS = set(_ELEMENT_RE.groupindex) - {"usepackage", "packages"}
+
+# Required elements for a valid LaTeX document: (group, pattern shown, description)
+_REQUIRED_ELEMENTS = [
+    ("documentclass", r"\\documentclass", "Document class declaration"),
+    ("begin_document", r"\\begin{document}", "Document begin"),
+    ("end_document", r"\\end{document}", "Document end"),
+]
+
+# Common issues that might cause compilation problems
+_POTENTIAL_ISSUES = [
+    (
+        _compile_linear(r"(?s)\\begin{document}.*\\begin{document}"),
+        "Multiple document beginnings detected",
+    ),
+    (
+        _compile_linear(r"(?s)\\end{document}.*\\end{document}"),
+        "Multiple document endings detected",
+    ),
+    (_compile_linear(r"(?s)[^\\]%.*\\"), "Potential unescaped percent sign in content"),
+]
+
+# Environment delimiters, for pairing \begin{name} with its \end{name}
+_ENVIRONMENT_RE = re.compile(r"\\(begin|end)\{([^}]+)\}")
+
+
+def _has_unmatched_environment(content: str) -> bool:
+    """Return True if environments are left open, closed without opening or misnested."""
+    open_environments: List[str] = []
+    for kind, name in _ENVIRONMENT_RE.findall(content):
+        if kind == "begin":
+            open_environments.append(name)
+        elif open_environments and open_environments[-1] == name:
+            open_environments.pop()
+        else:
+            return True
+    return bool(open_environments)
+
+
+# Constructs whose output is only right on a second pass: cross-references,
+# citations and lists read back from the .aux file, and hyperref bookmarks
+# read back from the .out file
+_SECOND_PASS_RE = re.compile(
+    r"\\(?:(?:page|auto|name|eq)?ref|cite[a-zA-Z]*|tableofcontents|listoffigures"
+    r"|listoftables|bibliography)(?![a-zA-Z])"
+    r"|\\usepackage(?:\[[^\]]*\])?\{[^}]*\bhyperref\b"
+)
+
+
+# Supported engines: the message shown when an engine is not installed. Tectonic
+# reruns itself until references settle, so it is always invoked once.
+_ENGINE_INSTALL_HINTS = {
+    "pdflatex": "pdflatex not found. Please install TeX Live with pdflatex.",
+    "tectonic": "tectonic not found. Please install Tectonic.",
+}
+
+
+# Packages needed by common commands: (command group, package, suggestion)
+_COMMON_COMMANDS = [
+    ("geometry", "geometry", "geometry package needed for \\geometry command"),
+    ("xcolor", "xcolor", "xcolor package needed for color commands"),
+    ("hyperref", "hyperref", "hyperref package needed for links"),
+    ("enumitem", "enumitem", "enumitem package recommended for itemize options"),
+]
+_CHECKED_PACKAGES = {package for _, package, _ in _COMMON_COMMANDS}
+
+
+@functools.lru_cache(maxsize=None)
+def _check_installation(engine: str) -> None:
+    """Run ``engine --version`` once per process; see ``validate_latex_installation``."""
+    try:
+        result = subprocess.run([engine, "--version"], capture_output=True, check=True, timeout=10)
+        if logger.isEnabledFor(logging.DEBUG):
+            version = result.stdout.decode()[:100]
+            logger.debug("%s version check successful: %s...", engine, version)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"{engine} installation check timed out")
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        raise RuntimeError(_ENGINE_INSTALL_HINTS[engine]) from e
+
+
 @dataclass
 class LaTeXValidationResult:
     """Result of LaTeX structure validation."""
@@ -25,10 +151,17 @@ class LaTeXCompilationResult:
 
     success: bool
     tex_base64: str
-    pdf_base64: Optional[str]
+    pdf_bytes: Optional[bytes]
     log_output: str
     error_message: Optional[str]
 
+    @property
+    def pdf_base64(self) -> Optional[str]:
+        """The PDF base64-encoded, or None if compilation failed."""
+        if self.pdf_bytes is None:
+            return None
+        return base64.b64encode(self.pdf_bytes).decode("ascii")
+
 
 class UnifiedLatexConverter:
     """
@@ -36,33 +169,60 @@ class UnifiedLatexConverter:
 
     Features:
     - Comprehensive LaTeX structure validation
-    - Two-pass pdflatex compilation for proper references
-    - Base64-encoded output for both TEX and PDF
+    - Two-pass pdflatex compilation when references need it
+    - Base64-encoded TEX output, and the PDF as raw bytes or base64
     - Robust error handling and logging
     - Installation validation
+    - Choice of pdflatex or Tectonic as the engine
+    - Optional on-disk cache of successful compilations, keyed by content
+    - Concurrent compilation of many documents
+
+    Compilation is deterministic in the source, so when ``cache_dir`` is set
+    each successful result is stored there under the SHA-256 of the engine and
+    content, and compiling the same source again returns it without running
+    LaTeX.
     """
 
-    def __init__(self) -> None:
-        """Initialize the converter and validate LaTeX installation."""
-        self.validate_latex_installation()
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "beetune" / "latex"
+
+    def __init__(
+        self,
+        engine: str = "pdflatex",
+        cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
+        """
+        Initialize the converter and validate LaTeX installation.
+
+        Args:
+            engine: The LaTeX engine to compile with ("pdflatex" or "tectonic")
+            cache_dir: Directory for cached compilation results (e.g.
+                ``UnifiedLatexConverter.DEFAULT_CACHE_DIR``). None disables caching.
+
+        Raises:
+            ValueError: If the engine is not supported
+        """
+        if engine not in _ENGINE_INSTALL_HINTS:
+            raise ValueError(f"Unsupported LaTeX engine: {engine}")
+        self.engine = engine
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
+        self.validate_latex_installation(engine)
 
     @staticmethod
-    def validate_latex_installation() -> None:
+    def validate_latex_installation(engine: str = "pdflatex") -> None:
         """
-        Check if pdflatex is installed and accessible.
+        Check if the LaTeX engine is installed and accessible.
+
+        A successful check is remembered for the rest of the process, so
+        creating further converters for the same engine does not run it again.
+        Failures are not remembered.
+
+        Args:
+            engine: The LaTeX engine to check
 
         Raises:
-            RuntimeError: If pdflatex is not found or not working
+            RuntimeError: If the engine is not found or not working
         """
-        try:
-            result = subprocess.run(
-                ["pdflatex", "--version"], capture_output=True, check=True, timeout=10
-            )
-            logger.debug(f"pdflatex version check successful: {result.stdout.decode()[:100]}...")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("pdflatex installation check timed out")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            raise RuntimeError("pdflatex not found. Please install TeX Live with pdflatex.") from e
+        _check_installation(engine)
 
     @staticmethod
     def validate_latex_structure(content: str) -> LaTeXValidationResult:
@@ -78,59 +238,44 @@ class UnifiedLatexConverter:
         missing_elements = []
         warnings = []
 
-        # Required elements for a valid LaTeX document
-        required_elements = [
-            (r"\\documentclass", "Document class declaration"),
-            (r"\\begin{document}", "Document begin"),
-            (r"\\end{document}", "Document end"),
-        ]
+        # Offset of the first occurrence of each element, and every imported package
+        found: Dict[Optional[str], int] = {}
+        packages: Set[str] = set()
+        for match in _ELEMENT_RE.finditer(content):
+            group = match.lastgroup
+            if group == "usepackage":
+                packages.update(name.strip() for name in match.group("packages").split(","))
+            elif group not in found:
+                found[group] = match.start()
+            else:
+                continue
+            if len(found) == len(_ELEMENT_GROUPS) and packages >= _CHECKED_PACKAGES:
+                # Every element seen; the rest of the document cannot change the result
+                break
 
         # Check for required elements
-        for pattern, description in required_elements:
-            if not re.search(pattern, content):
-                missing_elements.append(f"Missing {description} ({pattern})")
+        for group, shown, description in _REQUIRED_ELEMENTS:
+            if group not in found:
+                missing_elements.append(f"Missing {description} ({shown})")
 
         # Check for common issues that might cause compilation problems
-        potential_issues = [
-            (r"\\begin{document}.*\\begin{document}", "Multiple document beginnings detected"),
-            (r"\\end{document}.*\\end{document}", "Multiple document endings detected"),
-            (r"[^\\]%.*\\", "Potential unescaped percent sign in content"),
-            (r"\\begin{(\w+)}(?!.*\\end{\1})", "Unmatched begin/end environment pairs"),
-        ]
-
-        for pattern, warning in potential_issues:
-            if re.search(pattern, content, re.DOTALL):
+        for pattern, warning in _POTENTIAL_ISSUES:
+            if pattern.search(content):
                 warnings.append(warning)
 
+        if _has_unmatched_environment(content):
+            warnings.append("Unmatched begin/end environment pairs")
+
         # Check document order (documentclass should come before begin{document})
-        doc_class_pos = content.find("\\documentclass")
-        begin_doc_pos = content.find("\\begin{document}")
+        doc_class_pos = found.get("documentclass", -1)
+        begin_doc_pos = found.get("begin_document", -1)
 
         if doc_class_pos > begin_doc_pos and doc_class_pos != -1 and begin_doc_pos != -1:
             warnings.append("Document class should appear before \\begin{document}")
 
         # Check for basic LaTeX packages that might be needed
-        common_commands = [
-            (
-                "\\usepackage{geometry}",
-                r"\\geometry\{",
-                "geometry package needed for \\geometry command",
-            ),
-            (
-                "\\usepackage{xcolor}",
-                r"\\color\{|\\definecolor",
-                "xcolor package needed for color commands",
-            ),
-            ("\\usepackage{hyperref}", r"\\href\{|\\url\{", "hyperref package needed for links"),
-            (
-                "\\usepackage{enumitem}",
-                r"\\begin{itemize}.*\[.*\]",
-                "enumitem package recommended for itemize options",
-            ),
-        ]
-
-        for package, command_pattern, suggestion in common_commands:
-            if re.search(command_pattern, content) and package not in content:
+        for group, package, suggestion in _COMMON_COMMANDS:
+            if group in found and package not in packages:
                 warnings.append(suggestion)
 
         is_valid = len(missing_elements) == 0
@@ -140,7 +285,11 @@ class UnifiedLatexConverter:
         )
 
     def compile_latex(
-        self, content: str, validate_structure: bool = True
+        self,
+        content: str,
+        validate_structure: bool = True,
+        bypass_cache: bool = False,
+        return_log: bool = True,
     ) -> LaTeXCompilationResult:
         """
         Compile LaTeX content to PDF with comprehensive error handling.
@@ -148,6 +297,10 @@ class UnifiedLatexConverter:
         Args:
             content: The LaTeX content to compile
             validate_structure: Whether to perform structure validation first
+            bypass_cache: Compile even if a cached result exists (the new
+                result is still stored)
+            return_log: Include the engine log in successful results. When
+                False it may be left empty; failed results always carry it.
 
         Returns:
             LaTeXCompilationResult with compilation details
@@ -163,96 +316,107 @@ class UnifiedLatexConverter:
                 return LaTeXCompilationResult(
                     success=False,
                     tex_base64="",
-                    pdf_base64=None,
+                    pdf_bytes=None,
                     log_output="",
                     error_message=error_msg,
                 )
 
             if validation.warnings:
                 for warning in validation.warnings:
-                    logger.warning(f"LaTeX validation warning: {warning}")
+                    logger.warning("LaTeX validation warning: %s", warning)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = self._cache_file(content)
+        if cache_file is not None and not bypass_cache:
+            cached = self._load_cached(cache_file)
+            if cached is not None:
+                logger.debug("Using cached LaTeX compilation %s", cache_file.stem)
+                return cached
+
+        with tempfile.TemporaryDirectory(dir=SCRATCH_DIR) as temp_dir:
             tex_file = os.path.join(temp_dir, "document.tex")
             pdf_file = os.path.join(temp_dir, "document.pdf")
             log_file = os.path.join(temp_dir, "document.log")
 
             try:
-                # Write LaTeX content to file
-                with open(tex_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-
-                # Read tex content for base64 encoding
-                with open(tex_file, "rb") as f:
-                    tex_base64 = base64.b64encode(f.read()).decode("utf-8")
+                # Encode once; the same bytes are written and base64-encoded
+                tex_bytes = content.encode("utf-8")
+                with open(tex_file, "wb") as f:
+                    f.write(tex_bytes)
+                tex_base64 = base64.b64encode(tex_bytes).decode("ascii")
 
                 log_content = ""
-
-                # Compile LaTeX twice for proper references and cross-references
-                for pass_num in range(1, 3):
-                    logger.debug(f"LaTeX compilation pass {pass_num}/2")
+                # Cache entries keep the log for later callers that do want it
+                final_log_wanted = return_log or cache_file is not None
+
+                # Compile twice only when references or cross-references need it
+                if self.engine == "tectonic" or not _SECOND_PASS_RE.search(content):
+                    passes = 1
+                else:
+                    passes = 2
+                logger.debug("Compiling LaTeX with %s in %d pass(es)", self.engine, passes)
+                for pass_num in range(1, passes + 1):
+                    logger.debug("LaTeX compilation pass %d/%d", pass_num, passes)
 
                     process = subprocess.run(
-                        [
-                            "pdflatex",
-                            "-interaction=nonstopmode",
-                            "-file-line-error",
-                            "-halt-on-error",
-                            tex_file,
-                        ],
+                        [*self._engine_args(draft=pass_num < passes), tex_file],
                         cwd=temp_dir,
-                        capture_output=True,
-                        text=True,
+                        capture_output=True,  # Kept as bytes; decoded only on failure
                         timeout=60,  # 60 second timeout
                     )
 
-                    # Read log file if it exists
-                    if os.path.exists(log_file):
-                        with open(log_file, encoding="utf-8", errors="ignore") as f:
-                            log_content = f.read()
+                    # Each pass rewrites the log; only load it when it will be reported
+                    if process.returncode != 0 or (pass_num == passes and final_log_wanted):
+                        log_content = self._read_log(log_file)
 
                     # Check if compilation failed
                     if process.returncode != 0:
-                        error_output = f"Pass {pass_num} failed:\nSTDOUT:\n{process.stdout}\nSTDERR:\n{process.stderr}\nLOG:\n{log_content}"
+                        stderr = process.stderr.decode("utf-8", "ignore")
                         logger.error(
-                            f"LaTeX compilation failed on pass {pass_num}:\n{error_output}"
+                            "LaTeX compilation failed on pass %d:\nSTDOUT:\n%s\nSTDERR:\n%s\nLOG:\n%s",
+                            pass_num,
+                            process.stdout.decode("utf-8", "ignore"),
+                            stderr,
+                            log_content,
                         )
 
                         return LaTeXCompilationResult(
                             success=False,
                             tex_base64=tex_base64,
-                            pdf_base64=None,
+                            pdf_bytes=None,
                             log_output=log_content,
-                            error_message=f"LaTeX compilation error on pass {pass_num}: {process.stderr}",
+                            error_message=f"LaTeX compilation error on pass {pass_num}: {stderr}",
                         )
 
-                    logger.debug(f"Pass {pass_num} completed successfully")
+                    logger.debug("Pass %d completed successfully", pass_num)
 
                 # Check if PDF was generated
-                if not os.path.exists(pdf_file):
+                if not os.path.exists(pdf_file) or os.path.getsize(pdf_file) == 0:
                     error_msg = "PDF file was not generated despite successful compilation"
                     logger.error(error_msg)
                     return LaTeXCompilationResult(
                         success=False,
                         tex_base64=tex_base64,
-                        pdf_base64=None,
-                        log_output=log_content,
+                        pdf_bytes=None,
+                        log_output=log_content if final_log_wanted else self._read_log(log_file),
                         error_message=error_msg,
                     )
 
-                # Read PDF content for base64 encoding
-                with open(pdf_file, "rb") as f:
-                    pdf_base64 = base64.b64encode(f.read()).decode("utf-8")
+                # Kept raw; callers that need base64 encode on demand
+                with open(pdf_file, "rb") as pdf_handle:
+                    pdf_bytes = pdf_handle.read()
 
                 logger.debug("LaTeX compilation completed successfully")
 
-                return LaTeXCompilationResult(
+                result = LaTeXCompilationResult(
                     success=True,
                     tex_base64=tex_base64,
-                    pdf_base64=pdf_base64,
+                    pdf_bytes=pdf_bytes,
                     log_output=log_content,
                     error_message=None,
                 )
+                if cache_file is not None:
+                    self._store_cached(cache_file, result)
+                return result
 
             except subprocess.TimeoutExpired:
                 error_msg = "LaTeX compilation timed out after 60 seconds"
@@ -260,8 +424,8 @@ class UnifiedLatexConverter:
                 return LaTeXCompilationResult(
                     success=False,
                     tex_base64=tex_base64 if "tex_base64" in locals() else "",
-                    pdf_base64=None,
-                    log_output=log_content if "log_content" in locals() else "",
+                    pdf_bytes=None,
+                    log_output=self._read_log(log_file),
                     error_message=error_msg,
                 )
             except Exception as e:
@@ -270,11 +434,95 @@ class UnifiedLatexConverter:
                 return LaTeXCompilationResult(
                     success=False,
                     tex_base64=tex_base64 if "tex_base64" in locals() else "",
-                    pdf_base64=None,
-                    log_output=log_content if "log_content" in locals() else "",
+                    pdf_bytes=None,
+                    log_output=self._read_log(log_file),
                     error_message=error_msg,
                 )
 
+    def _engine_args(self, draft: bool) -> List[str]:
+        """Return the engine command line, without the input file."""
+        if self.engine == "tectonic":
+            return ["tectonic", "-X", "compile", "--keep-logs"]
+
+        args = ["pdflatex", "-interaction=nonstopmode", "-file-line-error", "-halt-on-error"]
+        if draft:
+            # Earlier passes only collect references; skip writing the PDF
+            args.append("-draftmode")
+        return args
+
+    def _cache_file(self, content: str) -> Optional[Path]:
+        """Return the cache entry path for ``content``, or None without a cache."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(f"{self.engine}\0{content}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _load_cached(cache_file: Path) -> Optional[LaTeXCompilationResult]:
+        """Return the cached result in ``cache_file``, or None if it is unusable."""
+        try:
+            entry = serialization.loads(cache_file.read_bytes())
+            pdf_base64 = entry.pop("pdf_base64")
+            entry["pdf_bytes"] = base64.b64decode(pdf_base64) if pdf_base64 is not None else None
+            return LaTeXCompilationResult(**entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning("Ignoring unreadable LaTeX cache entry %s: %s", cache_file, e)
+            return None
+
+    @staticmethod
+    def _store_cached(cache_file: Path, result: LaTeXCompilationResult) -> None:
+        """Write ``result`` to ``cache_file``; failures only cost the cache entry."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see a partial entry
+            partial = cache_file.with_name(
+                f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            # JSON has no bytes type, so entries keep the PDF base64-encoded
+            entry = asdict(result)
+            del entry["pdf_bytes"]
+            entry["pdf_base64"] = result.pdf_base64
+            partial.write_bytes(serialization.dumps(entry))
+            os.replace(partial, cache_file)
+        except OSError as e:
+            logger.warning("Could not write LaTeX cache entry %s: %s", cache_file, e)
+
+    @staticmethod
+    def _read_log(log_file: str) -> str:
+        """Return the pdflatex log, or an empty string if none was written."""
+        try:
+            with open(log_file, encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def compile_many(
+        self, contents: Sequence[str], max_workers: Optional[int] = None, **options: Any
+    ) -> List[LaTeXCompilationResult]:
+        """
+        Compile many documents concurrently.
+
+        Each compilation runs the engine in its own process and temporary
+        directory, so worker threads only wait on them.
+
+        Args:
+            contents: The LaTeX documents to compile
+            max_workers: Maximum number of simultaneous compilations
+                (defaults to the number of CPUs)
+            **options: Keyword arguments forwarded to :meth:`compile_latex`
+
+        Returns:
+            LaTeXCompilationResult for each document, in the same order
+        """
+        if not contents:
+            return []
+        workers = min(len(contents), max_workers or os.cpu_count() or 1)
+        compile_one = functools.partial(self.compile_latex, **options)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(compile_one, contents))
+
     def compile_latex_simple(self, content: str) -> Tuple[str, Optional[str]]:
         """
         Simple interface that maintains compatibility with existing code.
@@ -289,7 +537,7 @@ class UnifiedLatexConverter:
             ValueError: If LaTeX structure is invalid
             RuntimeError: If compilation fails
         """
-        result = self.compile_latex(content)
+        result = self.compile_latex(content, return_log=False)
 
         if not result.success:
             if result.error_message and "Invalid LaTeX structure" in result.error_message:
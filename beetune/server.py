@@ -7,60 +7,231 @@ Docker-first LaTeX compilation and file processing.
 
 # mypy: ignore-errors
 
-import base64
+import atexit
+import copy
+import io
 import logging
-import os
+import logging.handlers
+import queue
 import tempfile
-from io import BytesIO
-from typing import Any, Dict, Tuple
+import threading
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Tuple
 
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Request, jsonify, request, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.exceptions import RequestEntityTooLarge
-from werkzeug.utils import secure_filename
+
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover - depends on optional dependency
+    Compress = None
 
 from .config import get_config
-from .extractors import FileProcessor, FileUploadSecurity
-from .processors import TextAnalyzer
-from .renderers import DocumentStyler, UnifiedLatexConverter
-from .utils import BeetuneError
+from .utils import BeetuneError, ValidationError, serialization
+from .utils.scratch import SCRATCH_DIR
+
+# Extractors, the AI client and the LaTeX tooling are imported by the get_*()
+# accessors on first use, so a worker only loads what its requests need
+if TYPE_CHECKING:
+    from .extractors import FileProcessor, FileUploadSecurity
+    from .processors import TextAnalyzer
+    from .renderers import DocumentStyler, UnifiedLatexConverter
+
+
+def _configure_logging() -> None:
+    """
+    Log at INFO through a background thread, unless logging is already configured.
+
+    Request threads only enqueue records; a QueueListener writes them to stderr,
+    so a slow terminal or pipe never stalls a request.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+# Uploads up to this size stay in memory; larger ones spill to SCRATCH_DIR
+_UPLOAD_SPOOL_SIZE = 2 * 1024 * 1024
+
+
+class UploadRequest(Request):
+    """Request that spools uploaded files in memory before touching disk."""
+
+    def _get_file_stream(
+        self,
+        total_content_length: Any,
+        content_type: Any,
+        filename: Any = None,
+        content_length: Any = None,
+    ) -> Any:
+        return tempfile.SpooledTemporaryFile(
+            max_size=_UPLOAD_SPOOL_SIZE, mode="rb+", dir=SCRATCH_DIR
+        )
+
+
+def _upload_stream(stream: Any) -> BinaryIO:
+    """Return an ``io.IOBase`` view of an uploaded file's stream, positioned at the start."""
+    if not isinstance(stream, io.IOBase):
+        # SpooledTemporaryFile is not an IOBase before Python 3.11; use the file it wraps
+        inner = getattr(stream, "_file", None)
+        stream = inner if isinstance(inner, io.IOBase) else io.BytesIO(stream.read())
+    stream.seek(0)
+    return stream
+
+
+class SerializationJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by ``beetune.utils.serialization`` (orjson when installed)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return serialization.dumps(
+            obj,
+            pretty=kwargs.get("indent") is not None,
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+            default=kwargs.get("default", self.default),
+        ).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return serialization.loads(s)
+
+
 # Create Flask app
 app = Flask(__name__)
+app.request_class = UploadRequest
+app.json = SerializationJSONProvider(app)
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max file size
 
+# Compress JSON responses (base64 TeX and PDF payloads shrink several-fold);
+# PDFs sent as binary are not in COMPRESS_MIMETYPES and pass through untouched
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 4096
+app.config["COMPRESS_LEVEL"] = 4
+app.config["COMPRESS_BR_LEVEL"] = 4
+if Compress is not None:
+    Compress(app)
+
 # Configure CORS for local development
 CORS(app, origins=["http://localhost:3000"], supports_credentials=True)
 
-# Global instances
-file_processor = FileProcessor()
-file_security = FileUploadSecurity()
+# Improvement goal for résumés submitted without a job description
+_GENERAL_RESUME_GOAL = "make it clearer, more concise and more impactful"
+
+# Static description served by the root endpoint
+_API_INFO = {
+    "service": "beetune-api",
+    "version": "0.1.0",
+    "endpoints": {
+        "health": "GET /health",
+        "analyze_job": "POST /analyze/job",
+        "extract_text": "POST /resume/extract-text",
+        "suggest_improvements": "POST /resume/suggest-improvements",
+        "apply_improvements": "POST /document/apply-improvements",
+        "convert_latex": "POST /convert/latex",
+    },
+}
+
+# Global instances, created on first use. Concurrent first requests may race
+# to build them, so creation is serialized by _init_lock and double-checked.
+_init_lock = threading.Lock()
+file_processor = None
+file_security = None
+# Completions shared by every request, so repeated submissions skip the AI round-trip
+response_cache = None
 text_analyzer = None
 document_styler = None
 latex_converter = None
+# When a failed LaTeX converter construction was last seen (time.monotonic())
+_latex_checked_at = None
+_LATEX_RECHECK_SECONDS = 60
 
 
-def get_text_analyzer() -> TextAnalyzer:
-    """Lazy-load text analyzer."""
-    global text_analyzer
+def get_file_processor() -> "FileProcessor":
+    """Lazy-load file processor."""
+    global file_processor
+    if file_processor is None:
+        with _init_lock:
+            if file_processor is None:
+                from .extractors import FileProcessor
+                from .extractors import file_processor as file_processor_module
+
+                # Request threads already extract concurrently; a per-worker process pool
+                # on top would multiply processes under a multi-worker WSGI server.
+                file_processor_module.PAGE_PARALLEL_ENABLED = False
+                file_processor = FileProcessor()
+    return file_processor
+
+
+def get_file_security() -> "FileUploadSecurity":
+    """Lazy-load upload validator."""
+    global file_security
+    if file_security is None:
+        with _init_lock:
+            if file_security is None:
+                from .extractors import FileUploadSecurity
+
+                file_security = FileUploadSecurity()
+    return file_security
+
+
+def get_text_analyzer(use_cache: bool = True) -> "TextAnalyzer":
+    """
+    Lazy-load text analyzer.
+
+    Args:
+        use_cache: Serve repeated requests from the shared response cache.
+            If False, the returned analyzer neither reads nor fills it.
+    """
+    global response_cache, text_analyzer
     if text_analyzer is None:
-        config = get_config()
-        api_key = config.get_api_key()
-        endpoint = config.get_endpoint()
-        model = config.get_model()
-        text_analyzer = TextAnalyzer(api_key, base_url=endpoint, default_model=model)
-    return text_analyzer
+        with _init_lock:
+            if text_analyzer is None:
+                from .processors import ResponseCache, TextAnalyzer
+
+                response_cache = ResponseCache(ttl=3600, max_entries=1024)
+                config = get_config()
+                api_key = config.get_api_key()
+                endpoint = config.get_endpoint()
+                model = config.get_model()
+                text_analyzer = TextAnalyzer(
+                    api_key, base_url=endpoint, default_model=model, cache=response_cache
+                )
+    if use_cache:
+        return text_analyzer
+
+    # Shallow copy: shares the API clients, drops only the cache
+    uncached = copy.copy(text_analyzer)
+    uncached.cache = None
+    return uncached
+
+
+def wants_cache() -> bool:
+    """Return False if the current request asked to bypass the response cache."""
+    return request.args.get("nocache", "").lower() not in ("1", "true", "yes")
 
 
 def get_document_styler() -> "DocumentStyler":
     """Lazy-load document styler."""
     global document_styler
     if document_styler is None:
-        document_styler = DocumentStyler()
+        with _init_lock:
+            if document_styler is None:
+                from .renderers import DocumentStyler
+
+                document_styler = DocumentStyler()
     return document_styler
 
 
@@ -68,10 +239,36 @@ def get_latex_converter() -> "UnifiedLatexConverter":
     """Lazy-load LaTeX converter."""
     global latex_converter
     if latex_converter is None:
-        latex_converter = UnifiedLatexConverter()
+        with _init_lock:
+            if latex_converter is None:
+                from .renderers import UnifiedLatexConverter
+
+                latex_converter = UnifiedLatexConverter()
     return latex_converter
 
 
+def latex_available() -> bool:
+    """
+    Return True if the LaTeX converter is (or can now be) constructed.
+
+    A missing engine is only re-checked every ``_LATEX_RECHECK_SECONDS``, so
+    frequent health probes do not each spawn an engine process.
+    """
+    global _latex_checked_at
+    if latex_converter is not None:
+        return True
+
+    now = time.monotonic()
+    if _latex_checked_at is not None and now - _latex_checked_at < _LATEX_RECHECK_SECONDS:
+        return False
+    try:
+        get_latex_converter()
+    except Exception:
+        _latex_checked_at = now
+        return False
+    return True
+
+
 @app.errorhandler(RequestEntityTooLarge)
 def handle_file_too_large(e) -> Tuple[Dict[str, Any], int]:
     """Handle file size limit exceeded."""
@@ -87,7 +284,8 @@ def handle_beetune_exception(e) -> Tuple[Dict[str, Any], int]:
 @app.errorhandler(Exception)
 def handle_general_exception(e) -> Tuple[Dict[str, Any], int]:
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
+    # Unexpected failures always keep their traceback; expected ones above log it only at DEBUG
+    logger.exception("Unhandled exception: %s", e)
     return jsonify({"error": "InternalServerError", "message": "An internal error occurred"}), 500
 
 
@@ -95,20 +293,13 @@ def handle_general_exception(e) -> Tuple[Dict[str, Any], int]:
 def health_check() -> Tuple[Dict[str, Any], int]:
     """Health check endpoint."""
     try:
-        # Check if LaTeX is available
-        latex_available = True
-        try:
-            get_latex_converter()
-        except Exception:
-            latex_available = False
-
         # Check AI configuration
         ai_configured = get_config().is_configured()
 
         status = {
             "status": "healthy",
             "components": {
-                "latex": "available" if latex_available else "unavailable",
+                "latex": "available" if latex_available() else "unavailable",
                 "ai_provider": "configured" if ai_configured else "not_configured",
                 "file_processor": "ready",
             },
@@ -128,6 +319,9 @@ def analyze_job() -> Tuple[Dict[str, Any], int]:
     {
         "job_description": "Job description text..."
     }
+
+    Repeated submissions are answered from the response cache unless the
+    query string contains ``nocache=1``.
     """
     try:
         if not get_config().is_configured():
@@ -136,20 +330,20 @@ def analyze_job() -> Tuple[Dict[str, Any], int]:
                 400,
             )
 
-        data = request.get_json()
+        data = request.get_json(cache=False)
         if not data or "job_description" not in data:
             return jsonify({"error": "BadRequest", "message": "job_description is required"}), 400
 
         job_description = data["job_description"]
 
         # Perform analysis
-        analyzer = get_text_analyzer()
-        result = analyzer.analyze_job_description(job_description)
+        analyzer = get_text_analyzer(use_cache=wants_cache())
+        result = analyzer.analyze(job_description)
 
         return jsonify({"success": True, "analysis": result}), 200
 
     except Exception as e:
-        logger.error(f"Job analysis error: {str(e)}", exc_info=True)
+        logger.error("Job analysis error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({"error": "AnalysisError", "message": f"Job analysis failed: {str(e)}"}), 500
 
 
@@ -158,7 +352,7 @@ def extract_resume_text() -> Tuple[Dict[str, Any], int]:
     """
     Upload and extract text from resume files.
 
-    Supports: PDF, DOC, DOCX, TXT files
+    Supports: PDF, DOC, DOCX, TEX files
     """
     try:
         if "file" not in request.files:
@@ -168,36 +362,19 @@ def extract_resume_text() -> Tuple[Dict[str, Any], int]:
         if file.filename == "":
             return jsonify({"error": "BadRequest", "message": "No file selected"}), 400
 
-        # Security validation
-        if not file_security.is_allowed_file(file.filename):
-            return jsonify({"error": "InvalidFileType", "message": "File type not allowed"}), 400
-
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as temp_file:
-            file.save(temp_file.name)
-
-            try:
-                # Validate file
-                if not file_security.validate_file(temp_file.name):
-                    return (
-                        jsonify(
-                            {"error": "SecurityError", "message": "File failed security validation"}
-                        ),
-                        400,
-                    )
-
-                # Extract text
-                extracted_text = file_processor.extract_text(temp_file.name)
+        # Validate and extract straight from the spooled upload; nothing is copied to disk
+        stream = _upload_stream(file.stream)
+        try:
+            filename = get_file_security().validate_file_upload(stream, file.filename)
+        except ValidationError as e:
+            return jsonify({"error": "SecurityError", "message": str(e)}), 400
 
-                return jsonify({"success": True, "text": extracted_text, "filename": filename}), 200
+        extracted_text = get_file_processor().extract_text(stream, filename)
 
-            finally:
-                # Clean up temp file
-                os.unlink(temp_file.name)
+        return jsonify({"success": True, "text": extracted_text, "filename": filename}), 200
 
     except Exception as e:
-        logger.error(f"Text extraction error: {str(e)}", exc_info=True)
+        logger.error("Text extraction error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return (
             jsonify({"error": "ExtractionError", "message": f"Text extraction failed: {str(e)}"}),
             500,
@@ -214,6 +391,9 @@ def suggest_resume_improvements() -> Tuple[Dict[str, Any], int]:
         "resume_text": "Resume text...",
         "job_description": "Job description text..." (optional)
     }
+
+    Each résumé section is improved by its own request, all sent concurrently.
+    Cached like ``/analyze/job``; pass ``nocache=1`` to bypass the cache.
     """
     try:
         if not get_config().is_configured():
@@ -222,27 +402,41 @@ def suggest_resume_improvements() -> Tuple[Dict[str, Any], int]:
                 400,
             )
 
-        data = request.get_json()
+        data = request.get_json(cache=False)
         if not data or "resume_text" not in data:
             return jsonify({"error": "BadRequest", "message": "resume_text is required"}), 400
 
         resume_text = data["resume_text"]
         job_description = data.get("job_description")
 
-        # Perform analysis
-        analyzer = get_text_analyzer()
-
         if job_description:
-            # Targeted analysis with job description
-            result = analyzer.analyze_resume_against_job(resume_text, job_description)
+            # Targeted suggestions with job description
+            goal = f"tailor it to this job description:\n{job_description}"
         else:
-            # General resume analysis
-            result = analyzer.analyze_resume(resume_text)
+            goal = _GENERAL_RESUME_GOAL
 
-        return jsonify({"success": True, "analysis": result}), 200
+        analyzer = get_text_analyzer(use_cache=wants_cache())
+        sections = analyzer.suggest_improvements_by_section(resume_text, goal)
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    # Pre-sectioned clients read "analysis"; it holds every section's text
+                    "analysis": "\n\n".join(
+                        f"{title}:\n{suggestions}" for title, suggestions in sections
+                    ),
+                    "sections": [
+                        {"section": title, "suggestions": suggestions}
+                        for title, suggestions in sections
+                    ],
+                }
+            ),
+            200,
+        )
 
     except Exception as e:
-        logger.error(f"Resume analysis error: {str(e)}", exc_info=True)
+        logger.error("Resume analysis error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return (
             jsonify({"error": "AnalysisError", "message": f"Resume analysis failed: {str(e)}"}),
             500,
@@ -252,13 +446,13 @@ def suggest_resume_improvements() -> Tuple[Dict[str, Any], int]:
 @app.route("/document/apply-improvements", methods=["POST"])
 def apply_document_improvements() -> Tuple[Dict[str, Any], int]:
     """
-    Generate improved LaTeX resume based on analysis.
+    Generate a LaTeX resume with the suggested improvements embedded.
 
     Expected JSON payload:
     {
-        "resume_data": {...},  # Structured resume data
-        "improvements": [...], # List of improvements to apply
-        "template": "professional" (optional)
+        "resume_data": "Resume text...",
+        "improvements": [...], # List of improvement suggestions (optional)
+        "template": "modern" | "classic" | "minimal" (optional)
     }
     """
     try:
@@ -268,22 +462,48 @@ def apply_document_improvements() -> Tuple[Dict[str, Any], int]:
                 400,
             )
 
-        data = request.get_json()
+        data = request.get_json(cache=False)
         if not data or "resume_data" not in data:
             return jsonify({"error": "BadRequest", "message": "resume_data is required"}), 400
 
+        from .renderers import DocumentStyler, LaTeXStyle
+
         resume_data = data["resume_data"]
         improvements = data.get("improvements", [])
-        template = data.get("template", "professional")
+        if not isinstance(improvements, list) or not all(
+            isinstance(item, str) for item in improvements
+        ):
+            return (
+                jsonify(
+                    {"error": "BadRequest", "message": "improvements must be a list of strings"}
+                ),
+                400,
+            )
+
+        # Only styles with a template can be rendered
+        styles = {s.value: s for s in DocumentStyler.LATEX_TEMPLATES}
+        style = styles.get(data.get("template", LaTeXStyle.MODERN.value))
+        if style is None:
+            return (
+                jsonify(
+                    {
+                        "error": "BadRequest",
+                        "message": f"template must be one of: {', '.join(styles)}",
+                    }
+                ),
+                400,
+            )
 
         # Generate LaTeX resume
         formatter = get_document_styler()
-        latex_source = formatter.format_resume(resume_data, template, improvements)
+        latex_source = formatter.style_document(
+            resume_data, style=style, suggestions="\n".join(improvements)
+        )
 
         return jsonify({"success": True, "latex_source": latex_source}), 200
 
     except Exception as e:
-        logger.error(f"Resume formatting error: {str(e)}", exc_info=True)
+        logger.error("Resume formatting error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return (
             jsonify({"error": "FormattingError", "message": f"Resume formatting failed: {str(e)}"}),
             500,
@@ -300,18 +520,28 @@ def convert_latex_to_pdf() -> Tuple[Dict[str, Any], int]:
         "latex_source": "LaTeX source code...",
         "return_format": "base64" | "binary" (optional, defaults to base64)
     }
+
+    Alternatively, post the source itself with ``Content-Type: application/x-tex``
+    and pass ``return_format`` as a query parameter; this skips JSON decoding of
+    large documents.
     """
     try:
-        data = request.get_json()
-        if not data or "latex_source" not in data:
-            return jsonify({"error": "BadRequest", "message": "latex_source is required"}), 400
+        if request.mimetype == "application/x-tex":
+            latex_source = request.get_data(cache=False, as_text=True)
+            if not latex_source:
+                return jsonify({"error": "BadRequest", "message": "latex_source is required"}), 400
+            return_format = request.args.get("return_format", "base64")
+        else:
+            data = request.get_json(cache=False)
+            if not data or "latex_source" not in data:
+                return jsonify({"error": "BadRequest", "message": "latex_source is required"}), 400
 
-        latex_source = data["latex_source"]
-        return_format = data.get("return_format", "base64")
+            latex_source = data["latex_source"]
+            return_format = data.get("return_format", "base64")
 
         # Compile LaTeX
         converter = get_latex_converter()
-        result = converter.compile_latex(latex_source)
+        result = converter.compile_latex(latex_source, return_log=False)
 
         if not result.success:
             return (
@@ -326,14 +556,19 @@ def convert_latex_to_pdf() -> Tuple[Dict[str, Any], int]:
             )
 
         if return_format == "binary":
-            # Return PDF as binary data
-            pdf_data = base64.b64decode(result.pdf_base64)
-            return send_file(
-                BytesIO(pdf_data),
+            # Return PDF as binary data from a real file, so the WSGI server can
+            # send it with sendfile(2); the file is deleted when the response closes
+            pdf_file = tempfile.TemporaryFile(dir=SCRATCH_DIR)
+            pdf_file.write(result.pdf_bytes)
+            pdf_file.seek(0)
+            response = send_file(
+                pdf_file,
                 mimetype="application/pdf",
                 as_attachment=True,
                 download_name="resume.pdf",
             )
+            response.content_length = len(result.pdf_bytes)
+            return response
         else:
             # Return base64 encoded PDF
             return (
@@ -348,7 +583,7 @@ def convert_latex_to_pdf() -> Tuple[Dict[str, Any], int]:
             )
 
     except Exception as e:
-        logger.error(f"LaTeX conversion error: {str(e)}", exc_info=True)
+        logger.error("LaTeX conversion error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return (
             jsonify({"error": "ConversionError", "message": f"LaTeX conversion failed: {str(e)}"}),
             500,
@@ -358,20 +593,7 @@ def convert_latex_to_pdf() -> Tuple[Dict[str, Any], int]:
 @app.route("/", methods=["GET"])
 def index() -> Dict[str, Any]:
     """Root endpoint with API information."""
-    return jsonify(
-        {
-            "service": "beetune-api",
-            "version": "0.1.0",
-            "endpoints": {
-                "health": "GET /health",
-                "analyze_job": "POST /analyze/job",
-                "extract_text": "POST /resume/extract-text",
-                "suggest_improvements": "POST /resume/suggest-improvements",
-                "apply_improvements": "POST /resume/apply-improvements",
-                "convert_latex": "POST /convert/latex",
-            },
-        }
-    )
+    return jsonify(_API_INFO)
 
 
 def create_app() -> Flask:
@@ -379,6 +601,42 @@ def create_app() -> Flask:
     return app
 
 
+def create_asgi_app():
+    """ASGI application factory used when serving under uvicorn."""
+    from asgiref.wsgi import WsgiToAsgi
+
+    return WsgiToAsgi(app)
+
+
+def run_server(host: str, port: int, debug: bool = False, workers: int = 1) -> None:
+    """
+    Serve the API.
+
+    Debug mode uses Flask's development server with its reloader. Otherwise the
+    app is served by uvicorn, which runs requests concurrently on a thread pool
+    and across ``workers`` processes.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        debug: Use Flask's development server in debug mode
+        workers: Number of uvicorn worker processes
+    """
+    if debug:
+        app.run(host=host, port=port, debug=True)
+        return
+
+    import uvicorn
+
+    uvicorn.run(
+        "beetune.server:create_asgi_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+    )
+
+
 def main() -> None:
     """Entry point for beetune-server command."""
     import argparse
@@ -386,11 +644,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="beetune server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
 
     args = parser.parse_args()
 
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    run_server(args.host, args.port, debug=args.debug, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ validation helpers, and shared functionality.
 
 from .exceptions import (
     BeetuneError,
+    BeetuneException,
     LaTeXError,
     OpenAIError,
     ProcessingError,
@@ -15,6 +16,7 @@ from .exceptions import (
 
 __all__ = [
     "BeetuneError",
+    "BeetuneException",
     "ValidationError",
     "ProcessingError",
     "OpenAIError",
@@ -12,34 +12,39 @@ class BeetuneError(Exception):
     """Base exception class for all beetune-related errors."""
 
     def __init__(self, message: str, detail: Optional[str] = None):
-        self.message = message
-        self.detail = detail or message
-        super().__init__(self.message)
+        # Both live in ``args`` only, which also lets them survive pickling
+        # (e.g. errors raised in a process pool worker)
+        super().__init__(message, detail or message)
+
+    @property
+    def message(self) -> str:
+        """Short description of the error."""
+        return self.args[0]
+
+    @property
+    def detail(self) -> str:
+        """Longer explanation, defaulting to the message."""
+        return self.args[1]
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ValidationError(BeetuneError):
     """Raised when input validation fails."""
 
-    def __init__(self, message: str, detail: Optional[str] = None):
-        super().__init__(message, detail)
-
 
 class ProcessingError(BeetuneError):
     """Raised when file or data processing fails."""
 
-    def __init__(self, message: str, detail: Optional[str] = None):
-        super().__init__(message, detail)
-
 
 class OpenAIError(BeetuneError):
     """Raised when OpenAI API calls fail."""
 
-    def __init__(self, message: str, detail: Optional[str] = None):
-        super().__init__(message, detail)
-
 
 class LaTeXError(BeetuneError):
     """Raised when LaTeX compilation fails."""
 
-    def __init__(self, message: str, detail: Optional[str] = None):
-        super().__init__(message, detail)
+
+# Legacy name kept for older integrations; the same class, so handlers for either catch both
+BeetuneException = BeetuneError
@@ -0,0 +1,14 @@
+"""
+Location for short-lived scratch files.
+
+Scratch files go to RAM-backed ``/dev/shm`` when it is writable, unless
+``TMPDIR`` explicitly points elsewhere.
+"""
+
+import os
+from typing import Optional
+
+# Directory for tempfile calls; None keeps the default location
+SCRATCH_DIR: Optional[str] = None
+if not os.environ.get("TMPDIR") and os.access("/dev/shm", os.W_OK):
+    SCRATCH_DIR = "/dev/shm"
@@ -0,0 +1,52 @@
+"""
+JSON serialization helpers for beetune.
+
+Uses ``orjson`` when it is installed (``pip install beetune[fast]``) and falls
+back to the standard library ``json`` module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON from ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    pretty: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent the output by two spaces
+        sort_keys: Sort object keys
+        default: Called for objects that are not natively serializable. With
+            orjson, datetimes are also routed through it so both backends
+            format them the same way.
+    """
+    if orjson is not None:
+        option = 0
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if pretty else None, sort_keys=sort_keys, default=default, ensure_ascii=False
+    ).encode("utf-8")
@@ -7,7 +7,7 @@ This script demonstrates how to use beetune for resume processing and analysis.
 
 import os
 
-from beetune import FileProcessor, JobAnalyzer, ResumeFormatter
+from beetune import DocumentStyler, FileProcessor
 from beetune.renderers import LaTeXStyle
 
 
@@ -55,25 +55,27 @@ def main():
     
     # 1. Format resume as LaTeX
     print("\n1. Formatting resume as LaTeX...")
-    formatter = ResumeFormatter()
-    latex_content = formatter.format_resume(resume_text, style=LaTeXStyle.MODERN)
+    formatter = DocumentStyler()
+    latex_content = formatter.style_document(resume_text, style=LaTeXStyle.MODERN)
     print(f"✅ Generated LaTeX document ({len(latex_content)} characters)")
     
     # 2. Analyze document (requires OpenAI API key)
     openai_key = os.getenv("OPENAI_API_KEY")
     if openai_key:
         print("\n2. Analyzing document...")
+        # Imported here so the OpenAI SDK is only loaded when it will be used
+        from beetune import TextAnalyzer
+
         analyzer = TextAnalyzer(openai_key)
         
         try:
             analysis = analyzer.analyze(job_description)
-            print(f"✅ Keywords: {analysis['keywords'][:100]}...")
-            print(f"✅ Benefits: {analysis['benefits'][:100]}...")
+            for key, value in analysis.items():
+                print(f"✅ {key.title()}: {value[:100]}...")
         except Exception as e:
             print(f"❌ Analysis failed: {e}")
     else:
         print("\n2. Skipping analysis (OPENAI_API_KEY not set)")
-")
     
     # 3. File processing example
     print("\n3. File processing capabilities:")
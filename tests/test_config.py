@@ -1,11 +1,15 @@
 """Tests for beetune configuration management."""
 
+import json
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from beetune.config import AIProvider, Config, ConfigError
+from beetune import config as beetune_config
+from beetune.config import AIProvider, Config, ConfigError, get_config, reset_config
 
 
 class TestConfig:
@@ -134,6 +138,36 @@ class TestConfig:
         assert new_config.get_api_key() == "sk-test"
         assert new_config.get_model() == "gpt-4"
 
+    def test_unchanged_config_file_is_not_reparsed(self) -> None:
+        """Test that loading an unchanged config file reuses the parsed data."""
+        self.config.set_provider(AIProvider.OPENAI, "sk-test")
+
+        with patch("beetune.config.serialization.loads") as mock_load:
+            first = Config(config_dir=self.config_dir)
+            second = Config(config_dir=self.config_dir)
+        mock_load.assert_not_called()
+
+        # Instances must not share mutable state through the cache
+        first.remove_provider("openai")
+        assert second.get_api_key() == "sk-test"
+
+        # A file that stops parsing also drops its cached contents
+        self.config.config_file.write_text("invalid json content, longer than before")
+        with pytest.raises(ConfigError):
+            Config(config_dir=self.config_dir)
+        assert self.config.config_file not in beetune_config._file_cache
+
+    def test_modified_config_file_is_reloaded(self) -> None:
+        """Test that external edits to the config file are picked up."""
+        self.config.set_provider(AIProvider.OPENAI, "sk-test")
+
+        config_file = self.config_dir / "config.json"
+        data = json.loads(config_file.read_text())
+        data["openai"]["api_key"] = "sk-rotated-key"
+        config_file.write_text(json.dumps(data))
+
+        assert Config(config_dir=self.config_dir).get_api_key() == "sk-rotated-key"
+
     def test_config_file_permissions(self) -> None:
         """Test that config file has correct permissions."""
         self.config.set_provider(AIProvider.OPENAI, "sk-test")
@@ -145,6 +179,21 @@ class TestConfig:
         file_mode = oct(config_file.stat().st_mode)[-3:]
         assert file_mode == "600"
 
+    def test_failed_save_leaves_no_partial_file(self) -> None:
+        """Test that the temporary file is private and removed when a save fails."""
+        modes = []
+
+        def failing_replace(src, dst):
+            modes.append(os.stat(src).st_mode & 0o777)
+            raise OSError("disk full")
+
+        with patch("beetune.config.os.replace", side_effect=failing_replace):
+            with pytest.raises(ConfigError, match="disk full"):
+                self.config.set_provider(AIProvider.OPENAI, "sk-test")
+
+        assert modes == [0o600]
+        assert list(self.config_dir.iterdir()) == []
+
     def test_error_no_provider_configured(self) -> None:
         """Test error when no provider is configured."""
         with pytest.raises(ConfigError, match="No AI provider configured"):
@@ -179,3 +228,28 @@ class TestConfig:
         # Should raise ConfigError when trying to load
         with pytest.raises(ConfigError, match="Failed to load config file"):
             Config(config_dir=self.config_dir)
+
+    def test_unchanged_config_is_not_rewritten(self) -> None:
+        """Test that saving identical settings skips the file write."""
+        self.config.set_provider(AIProvider.OPENAI, "sk-test")
+
+        with patch("beetune.config.os.replace", wraps=os.replace) as replace:
+            self.config.set_provider(AIProvider.OPENAI, "sk-test")
+            assert replace.call_count == 0
+
+            self.config.set_provider(AIProvider.OPENAI, "sk-other")
+            assert replace.call_count == 1
+
+        assert Config(config_dir=self.config_dir).get_api_key() == "sk-other"
+        assert list(self.config_dir.iterdir()) == [self.config.config_file]
+
+    def test_get_config_singleton_and_reset(self) -> None:
+        """Test that get_config returns one instance until it is reset."""
+        with patch("beetune.config.Path.home", return_value=Path(self.temp_dir)):
+            reset_config()
+            config = get_config()
+            assert get_config() is config
+
+            reset_config()
+            assert get_config() is not config
+        reset_config()
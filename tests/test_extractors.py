@@ -1,13 +1,72 @@
 """Tests for beetune extractors module."""
 
+import io
+import tempfile
 from io import BytesIO
+from unittest.mock import patch
 
+import docx
 import pytest
 
-from beetune.extractors import FileProcessor, FileUploadSecurity
+from beetune.extractors import (
+    FileProcessor,
+    FileUploadSecurity,
+    file_processor,
+    file_security,
+    pdf_router,
+)
 from beetune.utils import ProcessingError, ValidationError
 
 
+def _make_pdf(*page_texts):
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    page_count = len(page_texts)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(page_count))
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return out
+
+
+class _LegacySpooledFile:
+    """Stream with only the methods SpooledTemporaryFile has before Python 3.11."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._buffer.seek(offset, whence)
+
+
 class TestFileProcessor:
     """Test file processing functionality."""
 
@@ -28,6 +87,107 @@ class TestFileProcessor:
         result = processor.extract_text(BytesIO(tex_content.encode()), "test.tex")
         assert result == tex_content
 
+    def test_extract_text_tex_keeps_stream_open(self) -> None:
+        """Test LaTeX extraction preserves line endings and leaves the stream open."""
+        stream = BytesIO("Line one\r\nLigne deux é\n".encode("utf-8"))
+
+        assert FileProcessor.extract_text(stream, "cv.tex") == "Line one\r\nLigne deux é\n"
+        assert not stream.closed
+
+    def test_extract_text_tex_invalid_utf8(self) -> None:
+        """Test that undecodable LaTeX files raise ProcessingError."""
+        with pytest.raises(ProcessingError, match="Failed to extract text"):
+            FileProcessor.extract_text(BytesIO(b"\xff\xfe bad"), "cv.tex")
+
+    def test_extract_text_pdf(self) -> None:
+        """Test PDF text extraction with the default backend."""
+        pdf = _make_pdf("Hello World", "Second page")
+
+        result = FileProcessor.extract_text(BytesIO(pdf), "resume.pdf")
+        assert "Hello World" in result
+        assert "Second page" in result
+
+    def test_extract_text_pdf_pypdf2_fallback(self, monkeypatch) -> None:
+        """Test PDF text extraction without the optional PDFium backend."""
+        monkeypatch.setattr(file_processor, "pdfium", None)
+        FileProcessor.clear_cache()
+        pdf = _make_pdf("Hello World", "Second page")
+
+        result = FileProcessor.extract_text(BytesIO(pdf), "resume.pdf")
+        assert "Hello World" in result
+        assert "Second page" in result
+
+    def test_pdf_backends_join_pages_alike(self) -> None:
+        """Test that PDFium and PyPDF2 separate pages with the same newline."""
+        pytest.importorskip("pypdfium2")
+        pdf = _make_pdf("Hello World", "Second page")
+
+        expected = ("Hello World\nSecond page", 2)
+        assert FileProcessor._read_pdf_pdfium(BytesIO(pdf)) == expected
+        assert FileProcessor._read_pdf_pypdf2(BytesIO(pdf)) == expected
+
+    def test_extract_text_large_pdf_pypdf2_parallel(self, monkeypatch) -> None:
+        """Test that page-parallel PyPDF2 extraction keeps page order."""
+        monkeypatch.setattr(file_processor, "pdfium", None)
+        pages = [f"Page number {i}" for i in range(file_processor.PAGE_PARALLEL_THRESHOLD + 2)]
+
+        result = FileProcessor._read_pdf_pypdf2(BytesIO(_make_pdf(*pages)))
+        assert result == ("\n".join(pages), len(pages))
+
+    def test_extract_text_docx_skips_empty_paragraphs(self) -> None:
+        """Test DOCX extraction joins non-empty paragraphs."""
+        document = docx.Document()
+        for text in ["Jane Doe", "", "Software Engineer", ""]:
+            document.add_paragraph(text)
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+
+        result = FileProcessor.extract_text(stream, "resume.docx")
+        assert result == "Jane Doe Software Engineer"
+
+    def test_extract_text_cached_by_content(self) -> None:
+        """Test that repeated content is served from the extraction cache."""
+        FileProcessor.clear_cache()
+        with patch.object(FileProcessor, "_read_text", wraps=FileProcessor._read_text) as mock_read:
+            first = FileProcessor.extract_text(BytesIO(b"Same resume"), "a.tex")
+            second = FileProcessor.extract_text(BytesIO(b"Same resume"), "b.tex")
+            other = FileProcessor.extract_text(BytesIO(b"Other resume"), "c.tex")
+
+        assert first == second == "Same resume"
+        assert other == "Other resume"
+        assert mock_read.call_count == 2
+
+    def test_extract_text_cached_for_spooled_uploads(self) -> None:
+        """Test that spooled upload streams, with or without seekable(), are cached."""
+        FileProcessor.clear_cache()
+        spooled = tempfile.SpooledTemporaryFile()
+        spooled.write(b"Spooled resume")
+        spooled.seek(0)
+
+        with patch.object(FileProcessor, "_read_text", wraps=FileProcessor._read_text) as mock_read:
+            first = FileProcessor.extract_text(spooled, "a.tex")
+            second = FileProcessor.extract_text(_LegacySpooledFile(b"Spooled resume"), "b.tex")
+
+        assert first == second == "Spooled resume"
+        assert mock_read.call_count == 1
+
+    def test_process_many_keeps_order(self, tmp_path) -> None:
+        """Test extracting text from several files on disk."""
+        paths = []
+        for name in ["a.tex", "b.tex", "c.tex"]:
+            path = tmp_path / name
+            path.write_text(f"content of {name}", encoding="utf-8")
+            paths.append(path)
+
+        texts = FileProcessor.process_many(paths, max_workers=2)
+        assert texts == ["content of a.tex", "content of b.tex", "content of c.tex"]
+
+    def test_process_many_missing_file(self, tmp_path) -> None:
+        """Test that unreadable files raise ProcessingError."""
+        with pytest.raises(ProcessingError, match="Failed to read"):
+            FileProcessor.process_many([tmp_path / "missing.tex"])
+
 
 class TestFileSecurity:
     """Test file upload security functionality."""
@@ -50,6 +210,14 @@ class TestFileSecurity:
 
         assert "No file extension" in str(exc_info.value)
 
+    def test_validate_pdf_upload(self) -> None:
+        """Test that a PDF with a matching extension passes validation."""
+        security = FileUploadSecurity(allowed_extensions={"pdf"})
+
+        assert security.validate_file_upload(BytesIO(_make_pdf("Hi")), "My CV.PDF") == "My_CV.PDF"
+        with pytest.raises(ValidationError, match="Invalid file extension"):
+            security.validate_file_upload(BytesIO(b"text"), "notes.tex")
+
     def test_secure_filename(self) -> None:
         """Test secure filename generation."""
         security = FileUploadSecurity()
@@ -61,3 +229,75 @@ class TestFileSecurity:
         # Test dangerous characters
         result = security._secure_filename("../../../etc/passwd")
         assert result == "etc_passwd"
+
+    def test_read_header_with_and_without_peek(self) -> None:
+        """Test header reads from buffered and plain streams leave them at the start."""
+        data = b"%PDF-1.4 " + b"x" * 2048
+        buffered = io.BufferedReader(BytesIO(data))
+        plain = BytesIO(data)
+
+        assert FileUploadSecurity._read_header(buffered, 1024) == data[:1024]
+        assert buffered.tell() == 0
+        assert FileUploadSecurity._read_header(plain, 1024) == data[:1024]
+        assert plain.tell() == 0
+
+    def test_get_file_info_size(self) -> None:
+        """Test that file info reports the size and rewinds the stream."""
+        stream = BytesIO(b"%PDF-1.4 " + b"x" * 4096)
+
+        info = FileUploadSecurity().get_file_info(stream, "resume.pdf")
+        assert info["file_size_bytes"] == "4105"
+        assert info["extension"] == "pdf"
+        assert stream.tell() == 0
+
+    def test_get_file_info_size_unseekable(self) -> None:
+        """Test that file info counts the size of streams that cannot seek."""
+
+        class Unseekable(BytesIO):
+            def seekable(self) -> bool:
+                return False
+
+        info = FileUploadSecurity().get_file_info(Unseekable(b"x" * 70000), "resume.pdf")
+        assert info["file_size_bytes"] == "70000"
+
+    def test_get_file_info_extension(self) -> None:
+        """Test that only the final suffix is reported, lowercased."""
+        security = FileUploadSecurity()
+
+        assert security.get_file_info(BytesIO(b"x"), "Jane.Doe.CV.PDF")["extension"] == "pdf"
+        assert security.get_file_info(BytesIO(b"x"), "README")["extension"] == "none"
+
+    def test_read_header_rewinds_stream(self) -> None:
+        """Test that the header is read from the start even if the stream was advanced."""
+        stream = BytesIO(b"%PDF-1.4 test")
+        stream.read(4)
+
+        assert FileUploadSecurity._read_header(stream, 8) == b"%PDF-1.4"
+        assert stream.tell() == 0
+
+    def test_mime_detector_is_shared(self) -> None:
+        """Test that MIME detection reuses a fixed pool of libmagic instances."""
+        first = FileUploadSecurity().get_file_info(BytesIO(b"%PDF-1.4 test"), "a.pdf")
+        second = FileUploadSecurity().get_file_info(BytesIO(b"%PDF-1.4 test"), "b.pdf")
+
+        assert first["detected_mime_type"] == "application/pdf"
+        assert second["detected_mime_type"] == "application/pdf"
+        detectors = set()
+        for _ in range(3 * file_security.MIME_DETECTOR_POOL_SIZE):
+            with file_security._borrow_mime_detector() as detector:
+                detectors.add(id(detector))
+        assert len(detectors) == file_security.MIME_DETECTOR_POOL_SIZE
+
+
+class TestPdfRouter:
+    """Test PDF routing decisions."""
+
+    def test_route_text_pdf(self) -> None:
+        """Test that PDFs with a dense text layer use direct extraction."""
+        assert pdf_router.route("x" * 1000, page_count=2).method == "text"
+
+    def test_route_scanned_pdf(self) -> None:
+        """Test that PDFs with little embedded text are routed to OCR."""
+        decision = pdf_router.route("Page 1", page_count=3)
+        assert decision.method == "ocr"
+        assert decision.confidence < pdf_router.TEXT_CONFIDENCE_THRESHOLD
@@ -0,0 +1,367 @@
+"""Tests for beetune processors module."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import openai
+import pytest
+
+from beetune.processors import ResponseCache, TextAnalyzer, text_analyzer
+from beetune.utils import OpenAIError
+
+
+def _completion(content):
+    """Build a minimal chat completion response object."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestTextAnalyzer:
+    """Test text analyzer functionality."""
+
+    def setup_method(self) -> None:
+        """Set up an analyzer with mocked OpenAI clients."""
+        self.analyzer = TextAnalyzer("sk-test")
+        self.analyzer.client = MagicMock()
+        self.analyzer.aclient = MagicMock()
+
+    def test_analyze_parses_key_values(self) -> None:
+        """Test that analysis responses are parsed into a dictionary."""
+        self.analyzer.client.chat.completions.create.return_value = _completion(
+            "Topics: hiring, python\nSentiment: positive"
+        )
+
+        result = self.analyzer.analyze("Some text")
+        assert result == {"topics": "hiring, python", "sentiment": "positive"}
+
+    def test_parse_analysis_edge_cases(self) -> None:
+        """Test that keys split at the first colon and lines without one are skipped."""
+        content = "Note\n  Main Topic : a: b \r\nEmpty:\nkey: first\nKEY: second"
+
+        assert TextAnalyzer._parse_analysis(content) == {
+            "main topic": "a: b",
+            "empty": "",
+            "key": "second",
+        }
+
+    def test_clients_shared_between_analyzers(self) -> None:
+        """Test that analyzers with the same credentials reuse one client pair."""
+        first = TextAnalyzer("sk-shared")
+        second = TextAnalyzer("sk-shared")
+        other = TextAnalyzer("sk-shared", base_url="http://localhost:11434/v1")
+
+        assert first.client is second.client
+        assert first.aclient is second.aclient
+        assert other.client is not first.client
+        # Retries are left to tenacity, so the SDK must not retry as well
+        assert first.client.max_retries == 0
+        assert first.aclient.max_retries == 0
+
+    def test_close_shared_clients_closes_async_clients(self) -> None:
+        """Test that shutdown closes both clients of every shared pair."""
+        analyzer = TextAnalyzer("sk-closing")
+        client, aclient = analyzer.client, analyzer.aclient
+
+        with patch.object(client, "close") as close, patch.object(
+            aclient, "close", AsyncMock()
+        ) as aclose:
+            text_analyzer.close_shared_clients()
+
+        close.assert_called_once()
+        aclose.assert_awaited_once()
+        assert TextAnalyzer("sk-closing").client is not client
+
+    def test_analyze_wraps_api_errors(self) -> None:
+        """Test that API failures are surfaced as OpenAIError."""
+        self.analyzer.client.chat.completions.create.side_effect = RuntimeError("boom")
+
+        with pytest.raises(OpenAIError, match="Failed to analyze text"):
+            self.analyzer.analyze("Some text")
+
+    def test_analyze_retries_transient_errors(self) -> None:
+        """Test that transient API errors are retried before succeeding."""
+        self.analyzer.client.chat.completions.create.side_effect = [
+            openai.APITimeoutError(request=MagicMock()),
+            _completion("Sentiment: neutral"),
+        ]
+
+        with patch.object(TextAnalyzer._chat.retry, "sleep"):
+            result = self.analyzer.analyze("Some text")
+        assert result == {"sentiment": "neutral"}
+        assert self.analyzer.client.chat.completions.create.call_count == 2
+
+    def test_analyze_retries_server_errors(self) -> None:
+        """Test that 5xx responses are retried, as they are in concurrent mode."""
+        self.analyzer.client.chat.completions.create.side_effect = [
+            openai.InternalServerError("overloaded", response=MagicMock(), body=None),
+            _completion("Sentiment: neutral"),
+        ]
+
+        with patch.object(TextAnalyzer._chat.retry, "sleep"):
+            assert self.analyzer.analyze("Some text") == {"sentiment": "neutral"}
+        assert self.analyzer.client.chat.completions.create.call_count == 2
+
+    def test_analyze_does_not_retry_bad_requests(self) -> None:
+        """Test that non-transient API errors fail on the first attempt."""
+        self.analyzer.client.chat.completions.create.side_effect = openai.BadRequestError(
+            "bad request", response=MagicMock(), body=None
+        )
+
+        with pytest.raises(OpenAIError):
+            self.analyzer.analyze("Some text")
+        assert self.analyzer.client.chat.completions.create.call_count == 1
+
+    def test_analyze_and_suggest_async(self) -> None:
+        """Test that analysis and suggestions are gathered concurrently."""
+        self.analyzer.aclient.chat.completions.create = AsyncMock(
+            side_effect=[_completion("Sentiment: neutral"), _completion("  Be concise.  ")]
+        )
+
+        analysis, suggestions = asyncio.run(
+            self.analyzer.analyze_and_suggest_async("Some text", "clarity")
+        )
+        assert analysis == {"sentiment": "neutral"}
+        assert suggestions == "Be concise."
+        assert self.analyzer.aclient.chat.completions.create.await_count == 2
+
+    def test_suggest_improvements_by_section(self) -> None:
+        """Test that each résumé section gets its own request, in document order."""
+        resume = "Jane Doe\n\nEXPERIENCE\nAcme\n\nEducation:\nMIT\n"
+        self.analyzer.client.chat.completions.create.side_effect = lambda **kwargs: _completion(
+            "Tip for " + kwargs["messages"][-1]["content"].rsplit("Text:\n", 1)[1].split("\n")[0]
+        )
+
+        result = self.analyzer.suggest_improvements_by_section(resume, "clarity")
+
+        assert result == [
+            ("Header", "Tip for Jane Doe"),
+            ("EXPERIENCE", "Tip for EXPERIENCE"),
+            ("Education", "Tip for Education:"),
+        ]
+        assert self.analyzer.suggest_improvements_by_section("  ", "clarity") == []
+
+    def test_cache_skips_repeat_requests(self) -> None:
+        """Test that identical requests are served from the response cache."""
+        self.analyzer.cache = ResponseCache()
+        self.analyzer.client.chat.completions.create.return_value = _completion("Tip one")
+
+        assert self.analyzer.suggest_improvements("Text", "clarity") == "Tip one"
+        assert self.analyzer.suggest_improvements("Text", "clarity") == "Tip one"
+        assert self.analyzer.client.chat.completions.create.call_count == 1
+
+    def test_analyze_batch(self) -> None:
+        """Test that batch results are mapped back to input order."""
+        client = self.analyzer.client
+        client.files.create.return_value = SimpleNamespace(id="file-in")
+        client.batches.create.return_value = SimpleNamespace(id="batch-1")
+        client.batches.retrieve.return_value = SimpleNamespace(
+            status="completed", output_file_id="file-out"
+        )
+        lines = [
+            {
+                "custom_id": "1",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": "Sentiment: negative"}}]},
+                },
+            },
+            {
+                "custom_id": "0",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": "Sentiment: positive"}}]},
+                },
+            },
+        ]
+        client.files.content.return_value = SimpleNamespace(
+            content="\n".join(json.dumps(line) for line in lines).encode()
+        )
+
+        results = self.analyzer.analyze_batch(["good", "bad"])
+        assert results == [{"sentiment": "positive"}, {"sentiment": "negative"}]
+        assert client.batches.create.call_args.kwargs["input_file_id"] == "file-in"
+
+    def test_batch_results_populate_cache_with_one_embedding_call(self) -> None:
+        """Test that bulk results are embedded in a single request and cached."""
+        self.analyzer.cache = ResponseCache(similarity_threshold=0.9)
+        client = self.analyzer.client
+        client.embeddings.create.side_effect = lambda **kwargs: SimpleNamespace(
+            data=[
+                SimpleNamespace(index=i, embedding=[1.0, float(i)])
+                for i in range(len(kwargs["input"]))
+            ]
+        )
+        client.files.create.return_value = SimpleNamespace(id="file-in")
+        client.batches.create.return_value = SimpleNamespace(id="batch-1")
+        client.batches.retrieve.return_value = SimpleNamespace(
+            status="completed", output_file_id="file-out"
+        )
+        lines = [
+            {
+                "custom_id": str(i),
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": f"Tip {i}"}}]},
+                },
+            }
+            for i in range(3)
+        ]
+        client.files.content.return_value = SimpleNamespace(
+            content="\n".join(json.dumps(line) for line in lines).encode()
+        )
+
+        items = [("a", "clarity"), ("b", "clarity"), ("c", "clarity")]
+        assert self.analyzer.suggest_improvements_batch(items) == ["Tip 0", "Tip 1", "Tip 2"]
+        assert client.embeddings.create.call_count == 1
+        assert len(self.analyzer.cache) == 3
+
+        assert self.analyzer.suggest_improvements("b", "clarity") == "Tip 1"
+        client.chat.completions.create.assert_not_called()
+
+    def test_semantic_cache_embeds_text_within_goal(self) -> None:
+        """Test that only the user text is embedded and goals never cross-match."""
+        self.analyzer.cache = ResponseCache(similarity_threshold=0.9)
+        client = self.analyzer.client
+        client.embeddings.create.return_value = SimpleNamespace(
+            data=[SimpleNamespace(index=0, embedding=[1.0, 0.0])]
+        )
+        client.chat.completions.create.side_effect = [_completion("Tip A"), _completion("Tip B")]
+
+        assert self.analyzer.suggest_improvements("Text", "clarity") == "Tip A"
+        assert client.embeddings.create.call_args.kwargs["input"] == "Text"
+        assert self.analyzer.suggest_improvements("Text.", "clarity") == "Tip A"
+        assert self.analyzer.suggest_improvements("Text.", "brevity") == "Tip B"
+        assert client.chat.completions.create.call_count == 2
+
+    def test_wait_for_batch_failure(self) -> None:
+        """Test that a failed batch raises OpenAIError."""
+        self.analyzer.client.batches.retrieve.return_value = SimpleNamespace(
+            status="failed", output_file_id=None
+        )
+
+        with pytest.raises(OpenAIError, match="Batch did not complete"):
+            self.analyzer.wait_for_batch("batch-1")
+
+    def test_suggest_improvements_concurrent_retries(self) -> None:
+        """Test that concurrent suggestions keep order and retry transient errors."""
+        connection_error = openai.APIConnectionError(request=MagicMock())
+        self.analyzer.aclient.chat.completions.create = AsyncMock(
+            side_effect=[_completion("First"), connection_error, _completion("Second")]
+        )
+
+        with patch("beetune.processors._parallel.asyncio.sleep", AsyncMock()):
+            results = asyncio.run(
+                self.analyzer.suggest_improvements_concurrent_async(
+                    [("a", "clarity"), ("b", "brevity")], num_concurrent=1
+                )
+            )
+        assert results == ["First", "Second"]
+        assert self.analyzer.aclient.chat.completions.create.await_count == 3
+
+    def test_analyze_concurrent_keeps_order(self) -> None:
+        """Test that concurrent analyses are returned in input order."""
+        self.analyzer.aclient.chat.completions.create = AsyncMock(
+            side_effect=[_completion("Sentiment: positive"), _completion("Sentiment: negative")]
+        )
+
+        results = asyncio.run(
+            self.analyzer.analyze_concurrent_async(["good", "bad"], num_concurrent=1)
+        )
+        assert results == [{"sentiment": "positive"}, {"sentiment": "negative"}]
+
+    def test_suggest_improvements_stream(self) -> None:
+        """Test that streamed deltas are yielded in order."""
+        chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+            for part in ("Use ", None, "active voice.")
+        ]
+        self.analyzer.client.chat.completions.create.return_value = iter(chunks)
+
+        parts = list(self.analyzer.suggest_improvements_stream("Text", "clarity"))
+        assert parts == ["Use ", "active voice."]
+        assert self.analyzer.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+class TestResponseCache:
+    """Test response cache functionality."""
+
+    def _request(self, prompt: str, model: str = "gpt-4o") -> dict:
+        return {"model": model, "messages": [{"role": "user", "content": prompt}]}
+
+    def test_exact_hit_and_lru_eviction(self) -> None:
+        """Test exact-match lookups and eviction of the oldest entry."""
+        cache = ResponseCache(max_entries=2)
+        cache.set(self._request("a"), "A")
+        cache.set(self._request("b"), "B")
+        cache.set(self._request("c"), "C")
+
+        assert cache.get(self._request("a")) is None
+        assert cache.get(self._request("c")) == "C"
+        assert len(cache) == 2
+
+    def test_expired_entries_are_dropped(self) -> None:
+        """Test that entries older than the TTL are not returned."""
+        cache = ResponseCache(ttl=0)
+        cache.set(self._request("a"), "A")
+
+        assert cache.get(self._request("a")) is None
+
+    def test_semantic_hit_requires_same_parameters(self) -> None:
+        """Test that semantic matches respect threshold and request parameters."""
+        cache = ResponseCache(similarity_threshold=0.95)
+        cache.set(self._request("a"), "A", embedding=[1.0, 0.0])
+
+        assert cache.get(self._request("a2"), embedding=[0.99, 0.05]) == "A"
+        assert cache.get(self._request("a2"), embedding=[0.0, 1.0]) is None
+        assert cache.get(self._request("a2", model="other"), embedding=[1.0, 0.0]) is None
+
+    def test_semantic_hit_requires_same_scope(self) -> None:
+        """Test that semantic matches stay within the scope they were stored in."""
+        cache = ResponseCache(similarity_threshold=0.95)
+        cache.set(self._request("a"), "A", embedding=[1.0, 0.0], scope="analysis")
+
+        assert cache.get(self._request("a2"), [1.0, 0.0], scope="analysis") == "A"
+        assert cache.get(self._request("a2"), [1.0, 0.0], scope="suggestions") is None
+        assert cache.get(self._request("a"), scope="suggestions") == "A"
+
+    def test_semantic_hit_forgets_evicted_entries(self) -> None:
+        """Test that evicted or replaced entries are no longer semantic matches."""
+        cache = ResponseCache(max_entries=1, similarity_threshold=0.95)
+        cache.set(self._request("a"), "A", embedding=[1.0, 0.0])
+        assert cache.get(self._request("a2"), embedding=[1.0, 0.0]) == "A"
+
+        cache.set(self._request("b"), "B", embedding=[0.0, 1.0])
+        assert cache.get(self._request("a2"), embedding=[1.0, 0.0]) is None
+        assert cache.get(self._request("b2"), embedding=[0.0, 1.0]) == "B"
+
+    def test_persistent_tier_shared_between_instances(self, tmp_path) -> None:
+        """Test that exact matches persist to disk and survive a new cache."""
+        path = tmp_path / "cache" / "responses.sqlite3"
+        writer = ResponseCache(path=path)
+        writer.set(self._request("a"), "A")
+        writer.close()
+
+        reader = ResponseCache(path=path)
+        assert len(reader) == 0
+        assert reader.get(self._request("a")) == "A"
+        assert reader.get(self._request("b")) is None
+        assert len(reader) == 1
+
+        reader.clear()
+        assert ResponseCache(path=path).get(self._request("a")) is None
+
+    def test_persistent_tier_file_is_private(self, tmp_path) -> None:
+        """Test that the persistent tier is created readable by its owner only."""
+        path = tmp_path / "responses.sqlite3"
+        ResponseCache(path=path).close()
+
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_persistent_tier_respects_ttl(self, tmp_path) -> None:
+        """Test that persisted entries older than the TTL are ignored."""
+        path = tmp_path / "responses.sqlite3"
+        ResponseCache(path=path).set(self._request("a"), "A")
+
+        with patch("beetune.processors.response_cache.time.time", return_value=1e12):
+            assert ResponseCache(ttl=60, path=path).get(self._request("a")) is None
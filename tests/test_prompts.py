@@ -0,0 +1,52 @@
+"""Tests for beetune prompts module."""
+
+from beetune import prompts
+from beetune.prompts import OutputFormat, PromptTone, gen_analysis, gen_suggestions
+
+
+class TestPromptGenerators:
+    """Test prompt generation functionality."""
+
+    def test_gen_analysis(self) -> None:
+        """Test that analysis prompts combine tone, format and text."""
+        prompt = gen_analysis("Hello", PromptTone.CONCISE, OutputFormat.NUMBERED_LIST)
+
+        assert prompt.startswith("You are an efficient career advisor")
+        assert "Present your response as a numbered list" in prompt
+        assert prompt.endswith("Text:\nHello\n\nExtract the key information now:")
+
+    def test_gen_suggestions(self) -> None:
+        """Test that suggestion prompts include the goal."""
+        prompt = gen_suggestions("Hello", "clarity")
+
+        assert "focus on the following goal: clarity." in prompt
+        assert prompt.endswith("Text:\nHello\n\nProvide your improvement suggestions:")
+
+    def test_braces_in_input_are_kept(self) -> None:
+        """Test that format placeholders in user input are not expanded."""
+        prompt = gen_suggestions("Use {text} here", "avoid {goal}")
+
+        assert "goal: avoid {goal}." in prompt
+        assert "Text:\nUse {text} here\n" in prompt
+
+    def test_package_exports(self) -> None:
+        """Test that the package re-exports every public generator name once."""
+        assert sorted(prompts.__all__) == sorted(set(prompts.__all__))
+        assert all(hasattr(prompts, name) for name in prompts.__all__)
+        assert "PromptTemplates" in prompts.__all__
+
+    def test_prompts_are_memoized(self) -> None:
+        """Test that repeated requests reuse the built prompt."""
+        gen_analysis.cache_clear()
+
+        first = gen_analysis("Same text")
+        second = gen_analysis("Same text")
+
+        assert first is second
+        assert gen_analysis.cache_info().hits == 1
+
+    def test_enums_keep_values_and_hash_by_identity(self) -> None:
+        """Test that enum members are still found by value and usable as keys."""
+        assert PromptTone("concise") is PromptTone.CONCISE
+        assert hash(OutputFormat.PARAGRAPH) == object.__hash__(OutputFormat.PARAGRAPH)
+        assert {PromptTone.CASUAL: 1}[PromptTone("casual")] == 1
@@ -0,0 +1,351 @@
+"""Tests for beetune renderers module."""
+
+import base64
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from beetune.renderers import DocumentStyler, LaTeXStyle, latex_converter
+from beetune.renderers.latex_converter import UnifiedLatexConverter
+
+
+class TestDocumentStyler:
+    """Test document styling functionality."""
+
+    def test_generate_latex_header(self) -> None:
+        """Test that headers carry the style preamble and open the document."""
+        header = DocumentStyler.generate_latex_header(LaTeXStyle.CLASSIC)
+
+        assert header.startswith("\\documentclass[11pt,a4paper]{article}\n\n")
+        assert "\\usepackage{enumitem}\n\n\\geometry{" in header
+        assert "definecolor" not in header
+        assert header.endswith("\\setlength{\\parskip}{0.5em}\n\n\\begin{document}\n")
+
+    def test_style_document_wraps_text(self) -> None:
+        """Test that styled documents wrap the text between header and end."""
+        document = DocumentStyler.style_document("Body text", style=LaTeXStyle.MODERN)
+
+        assert document == (
+            DocumentStyler.generate_latex_header(LaTeXStyle.MODERN) + "\nBody text\n\\end{document}"
+        )
+
+    def test_style_document_with_suggestions(self) -> None:
+        """Test that suggestions are embedded as comments before the document end."""
+        document = DocumentStyler.style_document(
+            "Body text", style=LaTeXStyle.MINIMAL, suggestions="Be concise\nAdd metrics"
+        )
+
+        assert document.endswith(
+            "\nBody text\n% IMPROVEMENT SUGGESTIONS:\n% Be concise\n% Add metrics\n\\end{document}"
+        )
+        assert UnifiedLatexConverter.validate_latex_structure(document).is_valid
+
+
+class TestLatexValidation:
+    """Test LaTeX structure validation."""
+
+    def test_styled_document_is_valid(self) -> None:
+        """Test that a styled document passes validation without warnings."""
+        document = DocumentStyler.style_document("Hello", style=LaTeXStyle.MODERN)
+
+        result = UnifiedLatexConverter.validate_latex_structure(document)
+        assert result.is_valid
+        assert result.missing_elements == []
+        assert result.warnings == []
+
+    def test_missing_elements_and_packages(self) -> None:
+        """Test that missing structure and packages are reported."""
+        content = "hello \\geometry{x} \\href{a}{b} 50% \\textbf{x}"
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert not result.is_valid
+        assert result.missing_elements == [
+            "Missing Document class declaration (\\\\documentclass)",
+            "Missing Document begin (\\\\begin{document})",
+            "Missing Document end (\\\\end{document})",
+        ]
+        assert result.warnings == [
+            "Potential unescaped percent sign in content",
+            "geometry package needed for \\geometry command",
+            "hyperref package needed for links",
+        ]
+
+    def test_document_class_after_begin(self) -> None:
+        """Test that a misplaced document class is reported."""
+        content = "\\begin{document}\\documentclass{article}\\end{document}"
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert result.is_valid
+        assert result.warnings == ["Document class should appear before \\begin{document}"]
+
+    def test_commands_on_one_line(self) -> None:
+        """Test that package checks see every command sharing a line."""
+        content = "\\begin{itemize}[leftmargin=*] \\href{a}{b} \\color{red}"
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert result.warnings == [
+            "Unmatched begin/end environment pairs",
+            "xcolor package needed for color commands",
+            "hyperref package needed for links",
+            "enumitem package recommended for itemize options",
+        ]
+
+    def test_package_options_and_lists(self) -> None:
+        """Test that packages loaded with options or in a list are recognized."""
+        content = (
+            "\\documentclass{article}\\usepackage[margin=1in]{geometry}"
+            "\\usepackage{xcolor, hyperref}\\begin{document}"
+            "\\geometry{a4paper}\\color{red}\\href{a}{b}\\end{document}"
+        )
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert result.warnings == []
+
+    def test_element_scan_stops_when_complete(self) -> None:
+        """Test that the element scan ends once every element has been seen."""
+        head = (
+            "\\documentclass{article}\\usepackage{geometry}\\usepackage{xcolor}"
+            "\\usepackage{hyperref}\\usepackage{enumitem}\\begin{document}"
+            "\\geometry{a4paper}\\color{red}\\url{x}\\begin{itemize}[nosep]\\end{itemize}"
+            "\\end{document}"
+        )
+        content = head + "\\end{document}" * 50
+        pattern = latex_converter._ELEMENT_RE
+        matches = pattern.finditer(content)
+
+        with patch.object(latex_converter, "_ELEMENT_RE") as element_re:
+            element_re.finditer.return_value = matches
+            result = UnifiedLatexConverter.validate_latex_structure(content)
+
+        assert result.is_valid
+        assert result.warnings == [
+            "Multiple document endings detected",
+            "Unmatched begin/end environment pairs",
+        ]
+        assert next(matches, None) is not None
+
+    def test_environment_must_close_after_opening(self) -> None:
+        """Test that an end before its begin does not count as a match."""
+        content = (
+            "\\documentclass{article}\\begin{document}\\end{table}\\begin{table}\\end{document}"
+        )
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert result.warnings == ["Unmatched begin/end environment pairs"]
+
+    def test_environments_must_nest(self) -> None:
+        """Test that misnested and starred environments are checked as pairs."""
+        head = "\\documentclass{article}\\begin{document}"
+        misnested = head + "\\begin{a}\\begin{b}\\end{a}\\end{b}\\end{document}"
+        starred = head + "\\begin{align*}x\\end{align*}\\end{document}"
+
+        assert UnifiedLatexConverter.validate_latex_structure(misnested).warnings == [
+            "Unmatched begin/end environment pairs"
+        ]
+        assert UnifiedLatexConverter.validate_latex_structure(starred).warnings == []
+
+    def test_structural_warnings(self) -> None:
+        """Test that duplicated and unmatched environments are flagged."""
+        content = (
+            "\\documentclass{article}\\begin{document}\\begin{itemize}x"
+            "\\begin{document}\\end{document}"
+        )
+
+        result = UnifiedLatexConverter.validate_latex_structure(content)
+        assert result.is_valid
+        assert result.warnings == [
+            "Multiple document beginnings detected",
+            "Unmatched begin/end environment pairs",
+        ]
+
+
+class TestLatexCompilation:
+    """Test LaTeX compilation handling."""
+
+    def test_failed_pass_returns_tex_payload(self) -> None:
+        """Test that a failed compilation still returns the encoded source."""
+        document = DocumentStyler.style_document("Résumé", style=LaTeXStyle.CLASSIC)
+        failure = SimpleNamespace(returncode=1, stdout=b"", stderr=b"! Undefined control sequence")
+
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", return_value=failure
+        ):
+            result = UnifiedLatexConverter().compile_latex(document)
+
+        assert not result.success
+        assert result.error_message == (
+            "LaTeX compilation error on pass 1: ! Undefined control sequence"
+        )
+        assert base64.b64decode(result.tex_base64).decode("utf-8") == document
+
+    def test_log_read_once_after_final_pass(self) -> None:
+        """Test that only the final pass log is loaded and reported."""
+        runs = []
+
+        def fake_pdflatex(args, cwd, **kwargs):
+            runs.append(args)
+            with open(os.path.join(cwd, "document.log"), "w", encoding="utf-8") as f:
+                f.write(f"pass {len(runs)}")
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+        document = DocumentStyler.style_document("See \\ref{intro}", style=LaTeXStyle.CLASSIC)
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", side_effect=fake_pdflatex
+        ), patch.object(
+            UnifiedLatexConverter, "_read_log", wraps=UnifiedLatexConverter._read_log
+        ) as read_log:
+            result = UnifiedLatexConverter().compile_latex(document)
+
+        assert len(runs) == 2
+        assert "-draftmode" in runs[0]
+        assert "-draftmode" not in runs[1]
+        assert read_log.call_count == 1
+        assert result.log_output == "pass 2"
+        assert result.error_message == "PDF file was not generated despite successful compilation"
+
+    def test_pdf_bytes_and_base64(self) -> None:
+        """Test that a generated PDF is returned raw and available base64-encoded."""
+        pdf_bytes = b"%PDF-1.5\n" + bytes(range(256)) * 64
+
+        def fake_pdflatex(args, cwd, **kwargs):
+            with open(os.path.join(cwd, "document.pdf"), "wb") as f:
+                f.write(pdf_bytes)
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+        document = DocumentStyler.style_document("Body", style=LaTeXStyle.CLASSIC)
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", side_effect=fake_pdflatex
+        ):
+            result = UnifiedLatexConverter().compile_latex(document)
+
+        assert result.success
+        assert result.pdf_bytes == pdf_bytes
+        assert base64.b64decode(result.pdf_base64) == pdf_bytes
+
+    def test_success_log_is_optional(self) -> None:
+        """Test that successful results skip the log unless it is requested."""
+
+        def fake_pdflatex(args, cwd, **kwargs):
+            with open(os.path.join(cwd, "document.log"), "w", encoding="utf-8") as f:
+                f.write("log")
+            with open(os.path.join(cwd, "document.pdf"), "wb") as f:
+                f.write(b"%PDF-1.5")
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+        document = DocumentStyler.style_document("Body", style=LaTeXStyle.CLASSIC)
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", side_effect=fake_pdflatex
+        ):
+            converter = UnifiedLatexConverter()
+            assert converter.compile_latex(document).log_output == "log"
+            assert converter.compile_latex(document, return_log=False).log_output == ""
+
+    def test_single_pass_without_references(self) -> None:
+        """Test that documents without references compile in one full pass."""
+        success = SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+        classic = DocumentStyler.style_document("Body", style=LaTeXStyle.CLASSIC)
+        modern = DocumentStyler.style_document("Body", style=LaTeXStyle.MODERN)
+
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", return_value=success
+        ) as run:
+            converter = UnifiedLatexConverter()
+            converter.compile_latex(classic)
+            assert run.call_count == 1
+            assert "-draftmode" not in run.call_args.args[0]
+
+            # hyperref bookmarks are only complete after a second pass
+            run.reset_mock()
+            converter.compile_latex(modern)
+            assert run.call_count == 2
+
+    def test_compile_many_keeps_order(self) -> None:
+        """Test that concurrent compilations return results in input order."""
+
+        def fake_pdflatex(args, cwd, **kwargs):
+            with open(args[-1], "rb") as source, open(os.path.join(cwd, "document.pdf"), "wb") as f:
+                f.write(source.read())
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+        documents = [
+            DocumentStyler.style_document(f"Body {i}", style=LaTeXStyle.CLASSIC) for i in range(8)
+        ]
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", side_effect=fake_pdflatex
+        ):
+            converter = UnifiedLatexConverter()
+            results = converter.compile_many(documents, max_workers=4, return_log=False)
+
+        assert converter.compile_many([]) == []
+        assert [base64.b64decode(r.pdf_base64).decode() for r in results] == documents
+
+    def test_tectonic_engine(self) -> None:
+        """Test that Tectonic is checked and invoked once, keeping its log."""
+        version = SimpleNamespace(returncode=0, stdout=b"Tectonic 0.15.0", stderr=b"")
+        success = SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+        document = DocumentStyler.style_document("See \\ref{intro}", style=LaTeXStyle.MODERN)
+
+        latex_converter._check_installation.cache_clear()
+        with patch.object(latex_converter.subprocess, "run", side_effect=[version, success]) as run:
+            UnifiedLatexConverter(engine="tectonic").compile_latex(document)
+
+        version_check, compile_call = run.call_args_list
+        assert version_check.args[0] == ["tectonic", "--version"]
+        assert compile_call.args[0][:4] == ["tectonic", "-X", "compile", "--keep-logs"]
+
+    def test_installation_checked_once(self) -> None:
+        """Test that only the first converter per engine runs the version check."""
+        version = SimpleNamespace(returncode=0, stdout=b"pdfTeX 3.141592653", stderr=b"")
+        latex_converter._check_installation.cache_clear()
+
+        with patch.object(latex_converter.subprocess, "run", return_value=version) as run:
+            UnifiedLatexConverter()
+            UnifiedLatexConverter()
+
+        run.assert_called_once()
+        latex_converter._check_installation.cache_clear()
+
+    def test_failed_installation_check_is_retried(self) -> None:
+        """Test that a missing engine is checked again by the next converter."""
+        latex_converter._check_installation.cache_clear()
+
+        with patch.object(latex_converter.subprocess, "run", side_effect=FileNotFoundError) as run:
+            for _ in range(2):
+                with pytest.raises(RuntimeError, match="pdflatex not found"):
+                    UnifiedLatexConverter()
+
+        assert run.call_count == 2
+
+    def test_unsupported_engine(self) -> None:
+        """Test that unknown engines are rejected before any check runs."""
+        with patch.object(latex_converter.subprocess, "run") as run:
+            with pytest.raises(ValueError, match="Unsupported LaTeX engine"):
+                UnifiedLatexConverter(engine="troff")
+
+        run.assert_not_called()
+
+    def test_successful_results_are_cached(self, tmp_path) -> None:
+        """Test that recompiling the same source is answered from the cache."""
+
+        def fake_pdflatex(args, cwd, **kwargs):
+            with open(os.path.join(cwd, "document.pdf"), "wb") as f:
+                f.write(b"%PDF-1.5")
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+        document = DocumentStyler.style_document("Body", style=LaTeXStyle.CLASSIC)
+        with patch.object(UnifiedLatexConverter, "validate_latex_installation"), patch.object(
+            latex_converter.subprocess, "run", side_effect=fake_pdflatex
+        ) as run:
+            converter = UnifiedLatexConverter(cache_dir=tmp_path)
+            first = converter.compile_latex(document)
+            second = UnifiedLatexConverter(cache_dir=tmp_path).compile_latex(document)
+            assert run.call_count == 1
+
+            converter.compile_latex(document, bypass_cache=True)
+            converter.compile_latex(document + "\n")
+            assert run.call_count == 3
+
+        assert second == first
+        assert len(list(tmp_path.glob("*.json"))) == 2
@@ -0,0 +1,135 @@
+"""Tests for beetune server module."""
+
+import uuid
+from datetime import datetime, timezone
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# The API server needs the optional server extra (pip install beetune[server])
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+from beetune import server  # noqa: E402
+from beetune.processors import TextAnalyzer  # noqa: E402
+
+
+class _LegacyUpload:
+    """Upload buffer with only the methods SpooledTemporaryFile has before Python 3.11."""
+
+    def __init__(self) -> None:
+        self._buffer = BytesIO()
+
+    def write(self, data: bytes) -> int:
+        return self._buffer.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._buffer.seek(offset, whence)
+
+
+class TestServer:
+    """Test API routes against mocked components."""
+
+    def setup_method(self) -> None:
+        """Set up a test client."""
+        self.client = server.app.test_client()
+
+    def test_error_handlers_registered(self) -> None:
+        """Test that every error handler targets a defined exception type."""
+        handlers = server.app.error_handler_spec[None][None]
+
+        assert all(isinstance(exc, type) for exc in handlers)
+        assert server.BeetuneError in handlers
+
+    def test_routes_call_existing_methods(self) -> None:
+        """Test that routes use methods the components actually provide."""
+        with patch.object(server, "get_text_analyzer") as get_analyzer, patch.object(
+            server.get_config(), "is_configured", return_value=True
+        ):
+            analyzer = MagicMock(spec=TextAnalyzer)
+            analyzer.analyze.return_value = {"topics": "python"}
+            get_analyzer.return_value = analyzer
+
+            response = self.client.post("/analyze/job", json={"job_description": "Python dev"})
+            assert response.get_json() == {"success": True, "analysis": {"topics": "python"}}
+
+            analyzer.suggest_improvements_by_section.return_value = [
+                ("Header", "Add a link"),
+                ("Skills", "Group by area"),
+            ]
+            response = self.client.post("/resume/suggest-improvements", json={"resume_text": "CV"})
+            assert response.get_json() == {
+                "success": True,
+                "analysis": "Header:\nAdd a link\n\nSkills:\nGroup by area",
+                "sections": [
+                    {"section": "Header", "suggestions": "Add a link"},
+                    {"section": "Skills", "suggestions": "Group by area"},
+                ],
+            }
+
+            response = self.client.post(
+                "/document/apply-improvements",
+                json={"resume_data": "Jane Doe", "improvements": ["Add metrics"]},
+            )
+            latex_source = response.get_json()["latex_source"]
+            assert "Jane Doe" in latex_source
+            assert "% Add metrics" in latex_source
+
+            for payload in (
+                {"template": "professional"},
+                {"template": "academic"},
+                {"improvements": "Add metrics"},
+                {"improvements": [{"text": "Add metrics"}]},
+            ):
+                response = self.client.post(
+                    "/document/apply-improvements", json={"resume_data": "Jane Doe", **payload}
+                )
+                assert response.status_code == 400
+
+    def test_health_rechecks_missing_latex_sparingly(self) -> None:
+        """Test that a missing LaTeX engine is not re-probed on every health check."""
+        with patch.object(server, "latex_converter", None), patch.object(
+            server, "_latex_checked_at", None
+        ), patch.object(server, "get_latex_converter", side_effect=RuntimeError) as get_converter:
+            for _ in range(3):
+                response = self.client.get("/health")
+                assert response.get_json()["components"]["latex"] == "unavailable"
+
+        assert get_converter.call_count == 1
+
+    def test_json_provider_uses_flask_default(self) -> None:
+        """Test that types Flask serializes via its default hook still work."""
+        moment = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        ident = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        with server.app.app_context():
+            response = server.jsonify({"at": moment, "id": ident})
+
+        assert response.get_json() == {
+            "at": "Wed, 01 May 2024 12:30:00 GMT",
+            "id": "12345678-1234-5678-1234-567812345678",
+        }
+
+    def test_extract_text_from_upload(self) -> None:
+        """Test text extraction from spooled and pre-3.11-style upload streams."""
+        upload = {"file": (BytesIO(b"\\section{Experience} Python"), "cv.tex")}
+        response = self.client.post("/resume/extract-text", data=upload)
+        assert response.get_json()["text"] == "\\section{Experience} Python"
+
+        with patch.object(
+            server.UploadRequest, "_get_file_stream", lambda *args, **kwargs: _LegacyUpload()
+        ):
+            upload = {"file": (BytesIO(b"Plain resume"), "cv.tex")}
+            response = self.client.post("/resume/extract-text", data=upload)
+        assert response.get_json() == {
+            "success": True,
+            "text": "Plain resume",
+            "filename": "cv.tex",
+        }